@@ -6,17 +6,21 @@ from typing import Optional
 
 import click
 
-from . import commands
+from . import commands, utils
 
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="crules")
-def cli():
+@click.option(
+    "--no-cache", is_flag=True, help="YAML front matterのキャッシュを使用しません"
+)
+def cli(no_cache: bool):
     """プロジェクトルール管理CLIツール
 
     このツールは、プロジェクトごとに異なるルールとノートを効率的に管理・配置するためのCLIツールです。
     """
-    pass
+    if no_cache:
+        utils.set_front_matter_cache_enabled(False)
 
 
 @cli.command()
@@ -167,9 +167,7 @@ def list_command(template_dir: str) -> Dict[str, List[Dict[str, Any]]]:
             for file in os.listdir(rules_path):
                 if file.endswith(".md"):
                     file_path = os.path.join(rules_path, file)
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    front_matter = utils.read_yaml_front_matter(content)
+                    front_matter = utils.read_yaml_front_matter(Path(file_path))
                     if front_matter:
                         rules.append(front_matter)
 
@@ -178,9 +176,7 @@ def list_command(template_dir: str) -> Dict[str, List[Dict[str, Any]]]:
             for file in os.listdir(notes_path):
                 if file.endswith(".md"):
                     file_path = os.path.join(notes_path, file)
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    front_matter = utils.read_yaml_front_matter(content)
+                    front_matter = utils.read_yaml_front_matter(Path(file_path))
                     if front_matter:
                         notes.append(front_matter)
 
@@ -191,7 +187,21 @@ def list_command(template_dir: str) -> Dict[str, List[Dict[str, Any]]]:
         return {"rules": [], "notes": []}
 
 
-def tree_command(template_dir: Optional[str] = None) -> str:
+def _count_entries(directory: str) -> int:
+    """ディレクトリ直下の隠しファイル以外のエントリ数を返します。
+
+    Args:
+        directory: 数えるディレクトリのパス
+
+    Returns:
+        int: エントリ数。ディレクトリが存在しない場合は0
+    """
+    if not os.path.isdir(directory):
+        return 0
+    return sum(1 for name in os.listdir(directory) if not name.startswith("."))
+
+
+def tree_command(template_dir: Optional[Union[str, Path]] = None) -> str:
     """テンプレートディレクトリの階層構造を表示
 
     Args:
@@ -201,16 +211,12 @@ def tree_command(template_dir: Optional[str] = None) -> str:
         str: ディレクトリ構造を表す文字列
     """
     # テンプレートディレクトリのパスを取得
-    if not template_dir:
-        template_dir = "template"
+    template_dir = os.fspath(template_dir) if template_dir else "template"
 
-    if not os.path.exists(template_dir):
+    if not os.path.isdir(template_dir):
         utils.log_error(f"テンプレートディレクトリが見つかりません: {template_dir}")
         return ""
 
-    # ディレクトリ階層を解析
-    hierarchy = utils.analyze_directory_hierarchy(template_dir)
-
     # 結果を格納する文字列
     result = []
 
@@ -218,12 +224,10 @@ def tree_command(template_dir: Optional[str] = None) -> str:
     result.append(f"テンプレートディレクトリ: {template_dir}")
     result.append(utils.get_directory_hierarchy_string(template_dir))
 
-    # 詳細情報を表示
+    # 詳細情報を表示（rules・notes直下の隠しファイル以外のエントリ数）
     result.append("\n詳細情報:")
-    rules_path = os.path.join(template_dir, "rules")
-    notes_path = os.path.join(template_dir, "notes")
-    rules_count = len(utils.list_files(rules_path)) if os.path.exists(rules_path) else 0
-    notes_count = len(utils.list_files(notes_path)) if os.path.exists(notes_path) else 0
+    rules_count = _count_entries(os.path.join(template_dir, "rules"))
+    notes_count = _count_entries(os.path.join(template_dir, "notes"))
     result.append(f"ルールファイル数: {rules_count}")
     result.append(f"ノートファイル数: {notes_count}")
 
@@ -256,7 +260,7 @@ def validate_rule_file(file_path: Path) -> None:
 
         # YAMLフロントマターを抽出
         _, yaml_content, _ = content.split("---", 2)
-        front_matter = yaml.safe_load(yaml_content)
+        front_matter = utils.load_yaml(yaml_content)
 
         # 必須フィールドの確認
         required_fields = ["description", "globs", "alwaysApply"]
@@ -290,7 +294,22 @@ def validate_note_file(file_path: Path) -> bool:
         return False
 
 
-def validate_command(path: str) -> bool:
+def _scan_files(directory: str, suffixes: Tuple[str, ...]) -> List[os.DirEntry]:
+    """ディレクトリ直下の指定した拡張子のファイルをos.scandirで列挙します。"""
+    with os.scandir(directory) as entries:
+        return sorted(
+            (
+                entry
+                for entry in entries
+                if not entry.name.startswith(".")
+                and entry.name.endswith(suffixes)
+                and entry.is_file()
+            ),
+            key=lambda entry: entry.name,
+        )
+
+
+def validate_command(path: Union[str, Path]) -> bool:
     """
     指定されたパスのルールとノートを検証します。
 
@@ -300,72 +319,71 @@ def validate_command(path: str) -> bool:
     Returns:
         bool: 検証が成功した場合はTrue、失敗した場合はFalse
     """
-    from pathlib import Path
-    import logging
-
-    project_path = Path(path)
-    rules_dir = project_path / "rules"
-    notes_dir = project_path / "notes"
+    path = os.fspath(path)
+    rules_dir = os.path.join(path, "rules")
+    notes_dir = os.path.join(path, "notes")
     has_errors = False
 
     # rulesディレクトリの検証
-    if not rules_dir.exists():
+    if not os.path.exists(rules_dir):
         logging.error("rulesディレクトリが存在しません")
         return False
 
     # ルールファイルの検証
-    rule_files = list(rules_dir.glob("*.md")) + list(rules_dir.glob("*.mdc"))
-    if not rule_files:
+    rule_entries = _scan_files(rules_dir, (".md", ".mdc"))
+    if not rule_entries:
         logging.error("ルールファイルが存在しません")
         return False
 
-    for rule_file in rule_files:
+    for entry in rule_entries:
         try:
-            content = rule_file.read_text(encoding="utf-8")
+            with open(entry.path, "r", encoding="utf-8") as f:
+                content = f.read()
             if not content.strip():
-                logging.error(f"{rule_file.name}: ファイルが空です")
+                logging.error(f"{entry.name}: ファイルが空です")
                 has_errors = True
                 continue
 
             # YAMLフロントマターの検証
             if "---" not in content:
-                logging.error(f"{rule_file.name}: YAMLフロントマターがありません")
+                logging.error(f"{entry.name}: YAMLフロントマターがありません")
                 has_errors = True
             else:
                 # YAMLフロントマターを抽出して検証
                 _, yaml_content, _ = content.split("---", 2)
-                front_matter = yaml.safe_load(yaml_content)
+                front_matter = utils.load_yaml(yaml_content)
                 
                 # 必須フィールドの確認
                 required_fields = ["description", "globs", "alwaysApply"]
                 for field in required_fields:
                     if field not in front_matter:
-                        logging.error(f"{rule_file.name}: 必須フィールド '{field}' がありません")
+                        logging.error(f"{entry.name}: 必須フィールド '{field}' がありません")
                         has_errors = True
 
         except Exception as e:
-            logging.error(f"{rule_file.name}: ファイルの読み込みに失敗しました - {str(e)}")
+            logging.error(f"{entry.name}: ファイルの読み込みに失敗しました - {str(e)}")
             has_errors = True
 
     # notesディレクトリの検証
-    if not notes_dir.exists():
+    if not os.path.exists(notes_dir):
         logging.error("notesディレクトリが存在しません")
         has_errors = True
     else:
-        note_files = list(notes_dir.glob("*.md"))
-        if not note_files:
+        note_entries = _scan_files(notes_dir, (".md",))
+        if not note_entries:
             logging.error("ノートファイルが存在しません")
             has_errors = True
         else:
-            for note_file in note_files:
+            for entry in note_entries:
                 try:
-                    content = note_file.read_text(encoding="utf-8")
+                    with open(entry.path, "r", encoding="utf-8") as f:
+                        content = f.read()
                     if not content.strip():
-                        logging.error(f"{note_file.name}: ファイルが空です")
+                        logging.error(f"{entry.name}: ファイルが空です")
                         has_errors = True
 
                 except Exception as e:
-                    logging.error(f"{note_file.name}: ファイルの読み込みに失敗しました - {str(e)}")
+                    logging.error(f"{entry.name}: ファイルの読み込みに失敗しました - {str(e)}")
                     has_errors = True
 
     return not has_errors
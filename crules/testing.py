@@ -2,6 +2,7 @@
 Testing utilities for the crules package.
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
@@ -18,34 +19,60 @@ def run_tests(
     coverage: bool = False,
     coverage_formats: Optional[List[str]] = None,
     verbose: bool = False,
+    coverage_html: bool = False,
+    coverage_xml: bool = False,
+    coverage_terminal: bool = False,
+    output_dir: Optional[str] = None,
 ) -> int:
     """
-    Run tests using pytest.
+    Run tests using pytest in a separate process.
 
     Args:
         test_path: Path to the test directory
         coverage: Whether to generate coverage report
-        coverage_formats: List of coverage report formats
+        coverage_formats: List of coverage report formats ("html", "xml", "term")
         verbose: Whether to run tests in verbose mode
+        coverage_html: Shortcut for adding "html" to coverage_formats
+        coverage_xml: Shortcut for adding "xml" to coverage_formats
+        coverage_terminal: Shortcut for adding "term" to coverage_formats
+        output_dir: Directory for the coverage data and reports
+            (defaults to the current directory)
 
     Returns:
         Exit code from pytest
     """
     try:
-        cmd = ["pytest"]
+        if importlib.util.find_spec("pytest") is None:
+            logger.error(
+                "pytest is not installed; install requirements-dev.txt to run tests"
+            )
+            return 1
+
+        cmd = [sys.executable, "-m", "pytest"]
+        env = None
 
         if verbose:
             cmd.append("-v")
 
         if coverage:
             cmd.extend(["--cov=crules"])
-            if coverage_formats:
-                for fmt in coverage_formats:
-                    cmd.extend([f"--cov-report={fmt}"])
+            formats = list(coverage_formats or [])
+            for enabled, fmt in (
+                (coverage_html, "html"),
+                (coverage_xml, "xml"),
+                (coverage_terminal, "term"),
+            ):
+                if enabled and fmt not in formats:
+                    formats.append(fmt)
+            for fmt in formats:
+                cmd.extend([f"--cov-report={_coverage_report_spec(fmt, output_dir)}"])
+            if output_dir is not None:
+                env = dict(os.environ)
+                env["COVERAGE_FILE"] = os.path.join(os.fspath(output_dir), ".coverage")
 
-        cmd.append(test_path)
+        cmd.append(os.fspath(test_path))
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True, text=True, env=env)
 
         if result.stdout:
             logger.info(result.stdout)
@@ -61,6 +88,27 @@ def run_tests(
         return 1
 
 
+def _coverage_report_spec(fmt: str, output_dir: Optional[str] = None) -> str:
+    """
+    Build the --cov-report value for a format, writing into output_dir if given.
+
+    Args:
+        fmt: Coverage report format ("html", "xml", "term", ...)
+        output_dir: Directory for the coverage reports
+
+    Returns:
+        Value for pytest-cov's --cov-report option
+    """
+    if output_dir is None:
+        return fmt
+    output_dir = os.fspath(output_dir)
+    if fmt == "html":
+        return f"html:{os.path.join(output_dir, 'htmlcov')}"
+    if fmt == "xml":
+        return f"xml:{os.path.join(output_dir, 'coverage.xml')}"
+    return fmt
+
+
 def run_coverage_report(
     formats: Optional[List[str]] = None, output_dir: Optional[str] = None
 ) -> int:
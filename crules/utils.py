@@ -2,62 +2,287 @@
 Utility functions for the crules package.
 """
 
+import copy
+import fnmatch
+import functools
+import hashlib
+import json
 import os
 import yaml
 import shutil
-import logging
+import tempfile
+import mmap
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import AnyStr, Dict, List, Optional, Union, Any
 from .exceptions import ValidationError, FileOperationError
 
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# libyamlが利用できる場合はCのローダーを使用する（純Pythonの実装より高速）
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def read_yaml_front_matter(content: Union[str, Path]) -> Optional[Dict[str, Any]]:
+
+def load_yaml(text: str) -> Any:
     """
-    マークダウンファイルからYAML front matterを読み込みます。
+    YAML文字列を安全にパースします。
 
     Args:
-        content: マークダウンファイルの内容またはファイルパス
+        text: YAML文字列
 
     Returns:
-        Optional[Dict[str, Any]]: YAML front matterの内容。存在しない場合はNone
+        Any: パース結果
+
+    Raises:
+        yaml.YAMLError: YAMLのパースに失敗した場合
     """
-    try:
-        # ファイルパスが渡された場合は内容を読み込む
-        if isinstance(content, Path):
-            with open(content, "r", encoding="utf-8") as f:
-                content = f.read()
+    return yaml.load(text, Loader=_YAML_LOADER)
 
-        # YAML front matterの開始と終了を検出
-        if not content.startswith("---\n"):
-            return None
 
-        end_index = content.find("\n---\n")
-        if end_index == -1:
-            return None
+# 最初のパースにかかる一度きりの初期化コストを、コマンドの実行中ではなくインポート時に払っておく。
+# PyYAMLのローダーは再利用できないため、インスタンスは保持しない（リゾルバの表はクラス単位で共有される）。
+try:
+    load_yaml("---\nx: 1\n")
+except yaml.YAMLError:
+    pass
+
+
+# パース済みYAML front matterの永続キャッシュ（JSON）の保存先
+FRONT_MATTER_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "crules"
+    / "frontmatter"
+)
+
+# 環境変数 CRULES_CACHE=0 で永続キャッシュを無効化できる
+_front_matter_cache_enabled = os.environ.get("CRULES_CACHE", "1") != "0"
+
+
+def set_front_matter_cache_enabled(enabled: bool) -> None:
+    """
+    YAML front matterの永続キャッシュの有効・無効を切り替えます。
+
+    Args:
+        enabled: キャッシュを使用する場合はTrue
+    """
+    global _front_matter_cache_enabled
+    _front_matter_cache_enabled = enabled
+
+
+def _with_base(path: Union[str, Path], base: Optional[str]) -> str:
+    """baseが指定された場合は、pathをbaseからの相対パスとして解決します。"""
+    path = os.fspath(path)
+    return os.path.join(base, path) if base is not None else path
 
-        # YAML front matterを抽出
-        yaml_content = content[4:end_index].strip()
-        if not yaml_content:
+
+def _extract_front_matter(text: AnyStr) -> Optional[AnyStr]:
+    """
+    マークダウンの内容からYAML front matterの部分を切り出します。
+
+    区切り行だけを確認してYAMLはパースしないため、front matterのない内容を安価に除外できます。
+    正規表現は使わず、bytesを渡した場合はデコードせずにそのまま切り出します。
+
+    Returns:
+        Optional[AnyStr]: 区切り行の間の部分。front matterがない場合はNone
+    """
+    if isinstance(text, bytes):
+        opening, closing, trailing = b"---\n", b"\n---\n", b"\n---"
+    else:
+        opening, closing, trailing = "---\n", "\n---\n", "\n---"
+
+    # YAML front matterの開始と終了を検出
+    if not text.startswith(opening):
+        return None
+
+    end_index = text.find(closing, 3)
+    if end_index == -1:
+        if not text.endswith(trailing):
             return None
+        end_index = len(text) - 4
 
-        # YAMLをパース
+    return text[4:end_index]
+
+
+def _parse_front_matter(content: str) -> Optional[Dict[str, Any]]:
+    """
+    マークダウンの内容からYAML front matterを抽出してパースします。
+
+    Raises:
+        yaml.YAMLError: YAMLのパースに失敗した場合
+    """
+    yaml_content = _extract_front_matter(content)
+    if yaml_content is None:
+        return None
+
+    yaml_content = yaml_content.strip()
+    if not yaml_content:
+        return None
+
+    return load_yaml(yaml_content)
+
+
+# 永続キャッシュの形式のバージョン（形式を変えた場合は上げて古いエントリを無視させる）
+_FRONT_MATTER_CACHE_VERSION = 1
+
+
+def _front_matter_cache_file(abspath: str) -> Path:
+    """
+    ファイルのパスからキャッシュファイルのパスを求めます。
+
+    キーはパスだけなので、ファイルを更新すると同じキャッシュファイルが上書きされます。
+    """
+    digest = hashlib.blake2b(abspath.encode("utf-8"), digest_size=16).hexdigest()
+    return FRONT_MATTER_CACHE_DIR / f"{digest}.json"
+
+
+def _write_front_matter_cache(
+    cache_file: Path, mtime_ns: int, size: int, front_matter: Optional[Dict[str, Any]]
+) -> None:
+    """パース結果をJSONとして保存します。JSONで表現できない値は保存しません。"""
+    try:
+        entry = {
+            "version": _FRONT_MATTER_CACHE_VERSION,
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "front_matter": front_matter,
+        }
+        serialized = json.dumps(entry, ensure_ascii=False)
+        if json.loads(serialized)["front_matter"] != front_matter:
+            return
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # 同じキーを複数のスレッドやプロセスが同時に書き込んでも衝突しない一時ファイル名にする
+        fd, tmp_file = tempfile.mkstemp(
+            prefix=f"{cache_file.name}.", suffix=".tmp", dir=cache_file.parent
+        )
         try:
-            return yaml.safe_load(yaml_content)
-        except yaml.YAMLError as e:
-            logger.warning(f"YAMLのパースに失敗しました: {str(e)}")
-            return None
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(serialized)
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+    except (TypeError, ValueError, OSError) as e:
+        logger.debug(f"YAML front matterのキャッシュ保存に失敗しました: {str(e)}")
+
+
+# これ未満のサイズのファイルはmmapせずに読み込む（mmapの準備の方が高くつくため）
+_MMAP_THRESHOLD = 4096
+
+
+def _read_front_matter_text(f) -> str:
+    """
+    バイナリモードで開いたファイルから、front matterの解析に必要な部分を読み込みます。
+
+    先頭が区切り行でないファイルは、残りを読まずに空文字列を返します（front matterなし）。
+    大きなファイルはmmapし、front matterの終端までだけを文字列にします。
+    改行コードはテキストモードと同じく\nに揃えます。
+    """
+    if f.read(4) not in (b"---\n", b"---\r"):
+        return ""
+    f.seek(0)
+
+    if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+        content = f.read().decode("utf-8")
+    else:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.find(b"\n---\n", 3)
+            content = (mm[: end + 5] if end != -1 else mm[:]).decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+@functools.lru_cache(maxsize=4096)
+def _read_front_matter_cached(
+    abspath: str, mtime_ns: int, size: int, persistent: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    ファイルからYAML front matterを読み込みます。
+
+    結果は (パス, 更新時刻, サイズ) ごとにプロセス内でキャッシュされるため、
+    ファイルが変更されると自動的に読み込み直されます。
+    persistentがTrueで永続キャッシュが有効な場合、未変更のファイルはYAMLを
+    パースせずにキャッシュ済みのJSONから読み込みます。
+    """
+    cache_file = None
+    if persistent and _front_matter_cache_enabled:
+        cache_file = _front_matter_cache_file(abspath)
+        try:
+            entry = json.loads(cache_file.read_text(encoding="utf-8"))
+            # 更新時刻・サイズ・形式のいずれかが異なるエントリは古いものとして無視する
+            if (entry["version"], entry["mtime_ns"], entry["size"]) == (
+                _FRONT_MATTER_CACHE_VERSION,
+                mtime_ns,
+                size,
+            ):
+                return entry["front_matter"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    with open(abspath, "rb") as f:
+        front_matter = _parse_front_matter(_read_front_matter_text(f))
+
+    if cache_file is not None:
+        _write_front_matter_cache(cache_file, mtime_ns, size, front_matter)
+    return front_matter
+
+
+def _read_front_matter_file(
+    file_path: Union[str, Path],
+    stat: Optional[os.stat_result] = None,
+    persistent: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    ファイルを一度だけstatし、キャッシュ付きでYAML front matterを読み込みます。
+
+    persistentがFalseの場合は、プロセス内のキャッシュだけを使い、永続キャッシュには
+    読み書きしません。
+    """
+    if stat is None:
+        stat = os.stat(file_path)
+    return _read_front_matter_cached(
+        os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, persistent
+    )
+
 
+def read_yaml_front_matter(
+    content: Union[str, Path], persistent: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    マークダウンファイルからYAML front matterを読み込みます。
+
+    Args:
+        content: マークダウンファイルの内容またはファイルパス
+        persistent: ファイルパスを渡した場合に永続キャッシュを読み書きするかどうか。
+            Falseの場合はプロセス内のキャッシュだけを使います。
+
+    Returns:
+        Optional[Dict[str, Any]]: YAML front matterの内容。存在しない場合はNone。
+    """
+    try:
+        # ファイルパスが渡された場合はファイルから読み込む（キャッシュと共有しないようコピーを返す）
+        if isinstance(content, Path):
+            front_matter = _read_front_matter_file(content, persistent=persistent)
+            return copy.deepcopy(front_matter)
+
+        return _parse_front_matter(content)
+
+    except yaml.YAMLError as e:
+        logger.warning(f"YAMLのパースに失敗しました: {str(e)}")
+        return None
     except Exception as e:
         logger.warning(f"YAML front matterの読み込みに失敗しました: {str(e)}")
         return None
 
 
+read_yaml_front_matter.cache_clear = _read_front_matter_cached.cache_clear
+
+
 def validate_file_content(
-    file_path: Union[str, Path], required_fields: Optional[List[str]] = None
+    file_path: Union[str, Path],
+    required_fields: Optional[List[str]] = None,
+    base: Optional[str] = None,
 ) -> List[str]:
     """
     ファイルの内容を検証します。
@@ -65,20 +290,15 @@ def validate_file_content(
     Args:
         file_path: 検証するファイルのパス
         required_fields: 必須フィールドのリスト（オプショナル）
+        base: 相対パスの基準ディレクトリ（省略時はカレントディレクトリ）
 
     Returns:
         List[str]: 不足している必須フィールドのリスト。空のリストは検証が成功したことを示します。
     """
+    file_path = _with_base(file_path, base)
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # YAMLフロントマターの検証
-        if not content.startswith("---\n"):
-            return required_fields or []
-
-        # YAMLフロントマターの抽出
-        front_matter = read_yaml_front_matter(content)
+        # YAMLフロントマターの抽出（検証では永続キャッシュに書き込まない）
+        front_matter = read_yaml_front_matter(Path(file_path), persistent=False)
         if not front_matter:
             return required_fields or []
 
@@ -91,19 +311,20 @@ def validate_file_content(
         return required_fields or []
 
 
-def ensure_directory(directory: Union[str, Path]) -> Path:
+def ensure_directory(directory: Union[str, Path], base: Optional[str] = None) -> Path:
     """
     Ensure a directory exists, creating it if necessary.
 
     Args:
         directory: Directory path
+        base: Directory that a relative path is resolved against (defaults to the cwd)
 
     Returns:
         Path object for the directory
     """
-    path = Path(directory)
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    directory = _with_base(directory, base)
+    os.makedirs(directory, exist_ok=True)
+    return Path(directory)
 
 
 def get_file_extension(file_path: Union[str, Path]) -> str:
@@ -168,41 +389,68 @@ def log_error(message: str) -> None:
 
 
 def list_files(
-    directory: str, pattern: Optional[str] = None, recursive: bool = False
+    directory: str,
+    pattern: Optional[str] = None,
+    recursive: bool = False,
+    base: Optional[str] = None,
 ) -> List[Path]:
     """
-    指定されたディレクトリ内のファイルをリストアップします。
+    指定されたディレクトリ内の通常のファイルをリストアップします。
+
+    ディレクトリとシンボリックリンクは結果に含めず、シンボリックリンクはたどりません。
+    os.scandirのDirEntryが保持する種別情報を使うため、エントリごとの
+    追加のstatは発生しません。
 
     Args:
         directory (str or Path): 検索対象のディレクトリ
         pattern (str, optional): ファイル名のパターン（glob形式）
         recursive (bool, optional): サブディレクトリも検索するかどうか
+        base (str, optional): 相対パスの基準ディレクトリ（省略時はカレントディレクトリ）
 
     Returns:
-        list: ファイルパスのリスト
+        List[Path]: ファイルパスのリスト
     """
-    directory = Path(directory)
-    if not directory.exists() or not directory.is_dir():
+    directory = _with_base(directory, base)
+    if not os.path.isdir(directory):
         return []
 
-    if pattern:
-        if recursive:
-            return list(directory.glob(f"**/{pattern}"))
-        else:
-            return list(directory.glob(pattern))
-    else:
-        if recursive:
-            return list(directory.glob("**/*"))
-        else:
-            return list(directory.glob("*"))
+    files = []
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    if pattern is None or fnmatch.fnmatch(entry.name, pattern):
+                        files.append(Path(entry.path))
+    return files
+
+
+# これより大きなファイルはread_fileのキャッシュに保持せず、毎回読み込む
+_READ_CACHE_MAX_SIZE = 1024 * 1024
 
 
-def read_file(file_path: str) -> str:
+@functools.lru_cache(maxsize=256)
+def _read_file_cached(abspath: str, mtime_ns: int, size: int) -> str:
+    """ファイルの内容を (パス, 更新時刻, サイズ) ごとにキャッシュして読み込みます。"""
+    with open(abspath, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def read_file(file_path: str, base: Optional[str] = None) -> str:
     """
     ファイルの内容を読み込みます。
 
+    内容はパス・更新時刻・サイズごとにキャッシュされるため、
+    変更のないファイルを繰り返し読み込んでもファイルは開きません。
+    _READ_CACHE_MAX_SIZEバイトを超えるファイルはキャッシュしません。
+
     Args:
         file_path (str or Path): 読み込むファイルのパス
+        base (str, optional): 相対パスの基準ディレクトリ（省略時はカレントディレクトリ）
 
     Returns:
         str: ファイルの内容
@@ -210,17 +458,50 @@ def read_file(file_path: str) -> str:
     Raises:
         FileOperationError: ファイルが存在しない場合、または読み込みに失敗した場合
     """
-    file_path = Path(file_path)
-    if not file_path.exists():
-        raise FileOperationError(f"ファイルが存在しません: {file_path}")
+    file_path = _with_base(file_path, base)
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError as e:
+        raise FileOperationError(f"ファイルが存在しません: {file_path}") from e
+    except OSError as e:
+        raise FileOperationError(f"ファイルの読み込みに失敗しました: {file_path}") from e
 
+    abspath = os.path.abspath(file_path)
+    read = (
+        _read_file_cached
+        if stat.st_size <= _READ_CACHE_MAX_SIZE
+        else _read_file_cached.__wrapped__
+    )
     try:
-        return file_path.read_text(encoding="utf-8")
+        return read(abspath, stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         raise FileOperationError(f"ファイルの読み込みに失敗しました: {file_path}") from e
 
 
-def resolve_conflict(source_path: str, target_path: str, force: bool = False) -> bool:
+read_file.cache_clear = _read_file_cached.cache_clear
+
+
+@functools.lru_cache(maxsize=256)
+def _read_bytes_cached(abspath: str, mtime_ns: int, size: int) -> bytes:
+    """ファイルのバイト列を (パス, 更新時刻, サイズ) ごとにキャッシュして読み込みます。"""
+    with open(abspath, "rb") as f:
+        return f.read()
+
+
+def _read_bytes_file(
+    file_path: Union[str, Path], stat: Optional[os.stat_result] = None
+) -> bytes:
+    """ファイルを一度だけstatし、キャッシュ付きでバイト列を読み込みます。"""
+    if stat is None:
+        stat = os.stat(file_path)
+    return _read_bytes_cached(
+        os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+    )
+
+
+def resolve_conflict(
+    source_path: str, target_path: str, force: bool = False, base: Optional[str] = None
+) -> bool:
     """
     ファイルの競合を解決します。
 
@@ -228,6 +509,7 @@ def resolve_conflict(source_path: str, target_path: str, force: bool = False) ->
         source_path (str or Path): ソースファイルのパス
         target_path (str or Path): ターゲットファイルのパス
         force (bool, optional): 強制上書きするかどうか
+        base (str, optional): 相対パスの基準ディレクトリ（省略時はカレントディレクトリ）
 
     Returns:
         bool: 競合が解決されたかどうか
@@ -235,16 +517,16 @@ def resolve_conflict(source_path: str, target_path: str, force: bool = False) ->
     Raises:
         FileOperationError: ファイルの操作に失敗した場合
     """
-    source_path = Path(source_path)
-    target_path = Path(target_path)
+    source_path = _with_base(source_path, base)
+    target_path = _with_base(target_path, base)
 
-    if not source_path.exists():
+    if not os.path.exists(source_path):
         raise FileOperationError(f"ソースファイルが存在しません: {source_path}")
 
-    if target_path.exists():
+    if os.path.exists(target_path):
         if force:
             try:
-                target_path.unlink()
+                os.unlink(target_path)
                 return True
             except Exception as e:
                 raise FileOperationError(f"ファイルの削除に失敗しました: {target_path}") from e
@@ -254,8 +536,68 @@ def resolve_conflict(source_path: str, target_path: str, force: bool = False) ->
     return True
 
 
+def place_file(
+    source_path: str, target_path: str, force: bool = False, base: Optional[str] = None
+) -> bool:
+    """
+    ソースファイルをターゲットにコピーして配置します。
+
+    コピーはshutil.copyfileで行い、内容をPython側で読み書きしません。
+    forceが指定されていない場合、ターゲットのサイズがソースと同じで、更新時刻が
+    ソース以降であれば最新とみなしてコピーを省略します。
+    コピー後はターゲットの更新時刻をソースに揃えます。
+
+    Args:
+        source_path (str or Path): ソースファイルのパス
+        target_path (str or Path): ターゲットファイルのパス
+        force (bool, optional): 既存のターゲットを常に上書きするかどうか
+        base (str, optional): 相対パスの基準ディレクトリ（省略時はカレントディレクトリ）
+
+    Returns:
+        bool: ターゲットが配置済みかどうか。forceが指定されておらず、ソースと異なる
+            ターゲットが既に存在する場合はコピーせずにFalseを返します。
+
+    Raises:
+        FileOperationError: ファイルの操作に失敗した場合
+    """
+    source_path = _with_base(source_path, base)
+    target_path = _with_base(target_path, base)
+
+    try:
+        source_stat = os.stat(source_path)
+    except FileNotFoundError as e:
+        raise FileOperationError(f"ソースファイルが存在しません: {source_path}") from e
+
+    try:
+        target_stat = os.stat(target_path)
+    except FileNotFoundError:
+        target_stat = None
+
+    if target_stat is not None and not force:
+        if (
+            source_stat.st_size == target_stat.st_size
+            and source_stat.st_mtime_ns <= target_stat.st_mtime_ns
+        ):
+            logger.debug(f"ターゲットは最新のためコピーを省略します: {target_path}")
+            return True
+        return False
+
+    try:
+        shutil.copyfile(source_path, target_path)
+        os.utime(target_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    except OSError as e:
+        raise FileOperationError(f"ファイルのコピーに失敗しました: {target_path}") from e
+    finally:
+        read_file.cache_clear()
+        _read_bytes_cached.cache_clear()
+
+    return True
+
+
 def validate_file_format(
-    file_path: str, required_fields: Optional[List[str]] = None
+    file_path: str,
+    required_fields: Optional[List[str]] = None,
+    base: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     ファイルのフォーマットを検証し、YAMLフロントマターを抽出します。
@@ -263,6 +605,7 @@ def validate_file_format(
     Args:
         file_path (str or Path): 検証するファイルのパス
         required_fields (list, optional): 必須フィールドのリスト
+        base (str, optional): 相対パスの基準ディレクトリ（省略時はカレントディレクトリ）
 
     Returns:
         dict: 抽出されたYAMLフロントマター
@@ -270,6 +613,7 @@ def validate_file_format(
     Raises:
         ValidationError: ファイルのフォーマットが無効な場合
     """
+    file_path = _with_base(file_path, base)
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -282,11 +626,11 @@ def validate_file_format(
 
     try:
         # YAMLフロントマターを解析
-        front_matter_end = content.find("\n---\n", 4)
-        if front_matter_end == -1:
+        yaml_content = _extract_front_matter(content)
+        if yaml_content is None:
             raise ValidationError(f"YAMLフロントマターの終端が見つかりません: {file_path}")
 
-        front_matter = yaml.safe_load(content[4:front_matter_end])
+        front_matter = load_yaml(yaml_content)
         if not isinstance(front_matter, dict):
             raise ValidationError(f"無効なYAMLフロントマター: {file_path}")
 
@@ -303,13 +647,19 @@ def validate_file_format(
         raise ValidationError(f"YAMLフロントマターの解析に失敗しました: {file_path}") from e
 
 
-def validate_file_size(file_path: str, max_size: int = 1024 * 1024) -> bool:
+def validate_file_size(
+    file_path: Union[str, Path, int],
+    max_size: int = 1024 * 1024,
+    base: Optional[str] = None,
+) -> bool:
     """
     ファイルサイズを検証します。
 
     Args:
-        file_path (str or Path): 検証するファイルのパス
+        file_path (str, Path or int): 検証するファイルのパス。os.scandirなどで
+            サイズが分かっている場合は、バイト数をそのまま渡すとstatを省略します。
         max_size (int, optional): 最大ファイルサイズ（バイト）
+        base (str, optional): 相対パスの基準ディレクトリ（省略時はカレントディレクトリ）
 
     Returns:
         bool: ファイルサイズが制限内の場合はTrue
@@ -318,11 +668,15 @@ def validate_file_size(file_path: str, max_size: int = 1024 * 1024) -> bool:
         ValidationError: ファイルサイズが制限を超えている場合
         FileOperationError: ファイルが存在しない場合
     """
-    file_path = Path(file_path)
-    if not file_path.exists():
-        raise FileOperationError(f"ファイルが存在しません: {file_path}")
+    if isinstance(file_path, int):
+        file_size = file_path
+    else:
+        file_path = _with_base(file_path, base)
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError as e:
+            raise FileOperationError(f"ファイルが存在しません: {file_path}") from e
 
-    file_size = file_path.stat().st_size
     if file_size > max_size:
         raise ValidationError(
             f"ファイルサイズが制限を超えています: {file_size} bytes " f"(最大: {max_size} bytes)"
@@ -332,7 +686,9 @@ def validate_file_size(file_path: str, max_size: int = 1024 * 1024) -> bool:
 
 
 def validate_file_structure(
-    file_path: str, required_sections: Optional[List[str]] = None
+    file_path: str,
+    required_sections: Optional[List[str]] = None,
+    base: Optional[str] = None,
 ) -> bool:
     """
     ファイルの構造を検証します。
@@ -340,30 +696,32 @@ def validate_file_structure(
     Args:
         file_path (str or Path): 検証するファイルのパス
         required_sections (list, optional): 必須セクションのリスト
+        base (str, optional): 相対パスの基準ディレクトリ（省略時はカレントディレクトリ）
 
     Returns:
-        bool: ファイル構造が有効な場合はTrue
+        bool: ファイル構造が有効な場合はTrue。YAMLフロントマターがない場合はFalse
 
     Raises:
         ValidationError: ファイル構造が無効な場合
         FileOperationError: ファイルが存在しない場合
     """
+    file_path = _with_base(file_path, base)
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        data = _read_bytes_file(file_path)
     except OSError as e:
         raise FileOperationError(f"ファイルを読み込めません: {file_path}") from e
 
-    # YAMLフロントマターの検証
-    if not content.startswith("---\n"):
-        raise ValidationError(f"YAMLフロントマターが見つかりません: {file_path}")
+    # テキストモードと同じく改行コードを\nに揃える
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
 
-    front_matter_end = content.find("\n---\n", 4)
-    if front_matter_end == -1:
-        raise ValidationError(f"YAMLフロントマターの終端が見つかりません: {file_path}")
+    # YAMLフロントマターの検証（区切り行のみを確認し、YAMLはパースもデコードもしない）
+    front_matter = _extract_front_matter(data)
+    if front_matter is None:
+        return False
 
     # Markdownコンテンツの検証
-    markdown_content = content[front_matter_end + 5 :]
+    markdown_content = data[len(front_matter) + 8 :].decode("utf-8", errors="replace")
     if not markdown_content.strip():
         raise ValidationError(f"Markdownコンテンツが空です: {file_path}")
 
@@ -398,20 +756,26 @@ def write_file(file_path: str, content: str, force: bool = False) -> bool:
     Raises:
         FileOperationError: ファイルの書き込みに失敗した場合
     """
-    file_path = Path(file_path)
+    file_path = os.fspath(file_path)
 
     # ディレクトリが存在しない場合は作成
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+    parent = os.path.dirname(file_path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
 
     # ファイルが存在し、forceがFalseの場合はエラー
-    if file_path.exists() and not force:
+    if not force and os.path.exists(file_path):
         raise FileOperationError(f"ファイルが既に存在します: {file_path}")
 
     try:
-        file_path.write_text(content, encoding="utf-8")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
         return True
     except Exception as e:
         raise FileOperationError(f"ファイルの書き込みに失敗しました: {file_path}") from e
+    finally:
+        read_file.cache_clear()
+        _read_bytes_cached.cache_clear()
 
 
 def analyze_directory_hierarchy(directory: str) -> Dict[str, Any]:
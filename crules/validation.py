@@ -1,3 +1,8 @@
+import yaml
+
+from .utils import load_yaml
+
+
 class ValidationError(Exception):
     """バリデーションエラーを表す例外クラス"""
 
@@ -24,7 +29,7 @@ def validate_rule_file(file_path: str) -> None:
     try:
         # YAMLフロントマターを抽出
         _, yaml_content, _ = content.split("---\n", 2)
-        yaml.safe_load(yaml_content)
+        load_yaml(yaml_content)
     except (ValueError, yaml.YAMLError) as e:
         raise ValidationError(f"YAMLフロントマターの形式が不正です: {str(e)}")
 
@@ -49,6 +54,6 @@ def validate_note_file(file_path: str) -> None:
     try:
         # YAMLフロントマターを抽出
         _, yaml_content, _ = content.split("---\n", 2)
-        yaml.safe_load(yaml_content)
+        load_yaml(yaml_content)
     except (ValueError, yaml.YAMLError) as e:
         raise ValidationError(f"YAMLフロントマターの形式が不正です: {str(e)}")
@@ -2,29 +2,31 @@
 Validation utilities for the crules package.
 """
 
-import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, Dict, Iterable, List, Union
 
 from .logger import get_logger
-from .utils import read_yaml_front_matter, validate_file_content
+from .utils import list_files, read_yaml_front_matter
 
 logger = get_logger(__name__)
 
+# Front matter fields required of a rule file unless the caller says otherwise
+DEFAULT_REQUIRED_FIELDS = ("title", "description", "tags", "severity")
+
 
 class FileValidator:
     """Validator for files in the crules package."""
 
-    def __init__(self, required_fields: List[str]):
+    def __init__(self, required_fields: Iterable[str] = DEFAULT_REQUIRED_FIELDS):
         """
         Initialize the validator.
 
         Args:
-            required_fields: List of required fields in the front matter
+            required_fields: Required fields in the front matter
         """
-        self.required_fields = required_fields
+        self.required_fields = list(required_fields)
 
-    def validate_file(self, file_path: Path) -> List[str]:
+    def validate_file(self, file_path: Union[str, Path]) -> List[str]:
         """
         Validate a file.
 
@@ -32,34 +34,34 @@ class FileValidator:
             file_path: Path to the file to validate
 
         Returns:
-            List of missing required fields
+            List of missing required fields, in the configured order
         """
-        try:
-            return validate_file_content(file_path, self.required_fields)
-        except Exception as e:
-            logger.error(f"Error validating file {file_path}: {e}")
-            return self.required_fields
+        # Validation only reads: keep the parse in memory, not in the on-disk cache
+        front_matter = read_yaml_front_matter(Path(file_path), persistent=False)
+        return self._missing_fields(front_matter)
+
+    def _missing_fields(self, front_matter: Any) -> List[str]:
+        """Return the required fields missing from the front matter."""
+        if not isinstance(front_matter, dict):
+            return list(self.required_fields)
+        return [field for field in self.required_fields if field not in front_matter]
 
     def validate_directory(self, directory: Path) -> Dict[Path, List[str]]:
         """
         Validate all files in a directory.
 
+        The tree is walked with os.scandir (see utils.list_files), so no
+        extra stat is made per entry. Symbolic links are not followed.
+
         Args:
             directory: Path to the directory to validate
 
         Returns:
             Dictionary mapping file paths to lists of missing required fields
         """
-        results = {}
-
         try:
-            for file_path in directory.glob("**/*"):
-                if file_path.is_file():
-                    missing_fields = self.validate_file(file_path)
-                    if missing_fields:
-                        results[file_path] = missing_fields
-
-            return results
+            files = list_files(directory, recursive=True)
+            return self.validate_files(files)
 
         except Exception as e:
             logger.error(f"Error validating directory {directory}: {e}")
@@ -5,38 +5,78 @@
 """
 
 import os
-import sys
 from pathlib import Path
 
 import pytest
-import shutil
 
-# プロジェクトのルートディレクトリをPYTHONPATHに追加
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from crules import utils
 
 # テスト用の環境変数を設定
-os.environ["CRULES_TEMPLATE_DIR"] = str(project_root / "template")
-os.environ["CRULES_TARGET_DIR"] = str(project_root / "target")
+_REPO_ROOT = Path(__file__).parent.parent
+os.environ["CRULES_TEMPLATE_DIR"] = str(_REPO_ROOT / "template")
+os.environ["CRULES_TARGET_DIR"] = str(_REPO_ROOT / "target")
+
+# サンプルファイルの内容
+_SAMPLE_CONFIG_TEXT = """
+# サンプル設定ファイル
+LOG_LEVEL: INFO
+LOG_FILE: test.log
+TEST_COVERAGE_THRESHOLD: 80.0
+"""
+
+_SAMPLE_LOG_TEXT = """
+2024-03-20 10:00:00,000 - INFO - テストログメッセージ1
+2024-03-20 10:00:01,000 - WARNING - テストログメッセージ2
+2024-03-20 10:00:02,000 - ERROR - テストログメッセージ3
+"""
 
 
 # テスト用のフィクスチャを定義
 @pytest.fixture(scope="session")
-def project_root():
-    """プロジェクトのルートディレクトリを返すフィクスチャ"""
-    return Path(__file__).parent.parent
+def repo_root():
+    """リポジトリのルートディレクトリを返すフィクスチャ"""
+    return _REPO_ROOT
 
 
 @pytest.fixture(scope="session")
-def template_dir(project_root):
+def template_dir(repo_root):
     """テンプレートディレクトリのパスを返すフィクスチャ"""
-    return project_root / "template"
+    return repo_root / "template"
 
 
 @pytest.fixture(scope="session")
-def target_dir(project_root):
+def target_dir(repo_root):
     """ターゲットディレクトリのパスを返すフィクスチャ"""
-    return project_root / "target"
+    return repo_root / "target"
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    serialマーカーの付いたテストに、pytest-xdistのxdist_groupマーカーを付ける
+
+    同じワーカーでの実行が保証されるのは、--dist=loadgroupを指定した場合だけです。
+    それ以外の分散モードやpytest-xdistを使わない場合、このマーカーは無視されます。
+    """
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+
+@pytest.fixture(autouse=True)
+def front_matter_cache_dir(tmp_path_factory, monkeypatch):
+    """YAML front matterのキャッシュをホームディレクトリではなく一時ディレクトリに保存するフィクスチャ"""
+    cache_dir = tmp_path_factory.mktemp("frontmatter_cache") / "crules"
+    monkeypatch.setattr(utils, "FRONT_MATTER_CACHE_DIR", cache_dir)
+    utils.read_yaml_front_matter.cache_clear()
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def clear_read_caches():
+    """ファイル内容のキャッシュをテストごとに破棄するフィクスチャ（pyfakefsで同じパスを使い回すため）"""
+    utils.read_file.cache_clear()
+    utils._read_bytes_cached.cache_clear()
+
 
 @pytest.fixture
 def temp_dir(tmp_path):
@@ -45,32 +85,38 @@ def temp_dir(tmp_path):
     """
     return tmp_path
 
+
+@pytest.fixture(scope="session")
+def _sample_config_path(tmp_path_factory):
+    """サンプルの設定ファイルをセッションで一度だけ作成するフィクスチャ"""
+    config_file = tmp_path_factory.mktemp("cfg") / "config.yaml"
+    config_file.write_text(_SAMPLE_CONFIG_TEXT)
+    return config_file
+
+
 @pytest.fixture
-def sample_config_file(temp_dir):
+def sample_config_file(_sample_config_path):
     """
     サンプルの設定ファイルを提供するフィクスチャ
     """
-    config_file = temp_dir / "config.yaml"
-    config_file.write_text("""
-# サンプル設定ファイル
-LOG_LEVEL: INFO
-LOG_FILE: test.log
-TEST_COVERAGE_THRESHOLD: 80.0
-""")
-    return config_file
+    return _sample_config_path
+
+
+@pytest.fixture(scope="session")
+def _sample_log_path(tmp_path_factory):
+    """サンプルのログファイルをセッションで一度だけ作成するフィクスチャ"""
+    log_file = tmp_path_factory.mktemp("log") / "test.log"
+    log_file.write_text(_SAMPLE_LOG_TEXT)
+    return log_file
+
 
 @pytest.fixture
-def sample_log_file(temp_dir):
+def sample_log_file(_sample_log_path):
     """
     サンプルのログファイルを提供するフィクスチャ
     """
-    log_file = temp_dir / "test.log"
-    log_file.write_text("""
-2024-03-20 10:00:00,000 - INFO - テストログメッセージ1
-2024-03-20 10:00:01,000 - WARNING - テストログメッセージ2
-2024-03-20 10:00:02,000 - ERROR - テストログメッセージ3
-""")
-    return log_file
+    return _sample_log_path
+
 
 @pytest.fixture
 def test_env(tmp_path):
@@ -84,23 +130,19 @@ def test_env(tmp_path):
 
     # 配置先ディレクトリを作成
     cursor_dir = tmp_path / ".cursor"
-    notes_dir = tmp_path / ".notes"
+    notes_target_dir = tmp_path / ".notes"
     cursor_dir.mkdir(parents=True)
-    notes_dir.mkdir(parents=True)
+    notes_target_dir.mkdir(parents=True)
 
-    yield {
+    # 一時ディレクトリはpytestが削除するためクリーンアップは不要
+    return {
         "template_dir": template_dir,
         "rules_dir": rules_dir,
         "notes_dir": notes_dir,
         "cursor_dir": cursor_dir,
-        "notes_dir": notes_dir,
+        "notes_target_dir": notes_target_dir,
     }
 
-    # クリーンアップ
-    shutil.rmtree(template_dir)
-    shutil.rmtree(cursor_dir)
-    shutil.rmtree(notes_dir)
-
 
 @pytest.fixture
 def test_case(test_env):
@@ -109,10 +151,7 @@ def test_case(test_env):
     case_dir = test_env["template_dir"] / "test_case"
     case_dir.mkdir(parents=True)
 
-    yield case_dir
-
-    # クリーンアップ
-    shutil.rmtree(case_dir)
+    return case_dir
 
 
 @pytest.fixture
@@ -0,0 +1,190 @@
+"""
+統合テスト用の共通フィクスチャ
+
+このモジュールは統合テストのモジュール間で共有するフィクスチャを提供します。
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from crules import utils
+
+
+# パーサーの実装が変わったらキャッシュ済みのfront matterを使わないよう、キーに含める
+_PARSER_DIGEST = hashlib.blake2b(
+    Path(utils.__file__).read_bytes(), digest_size=8
+).hexdigest()
+
+
+def cached_frontmatter(cache, path: Path) -> Any:
+    """
+    YAML front matterを読み込み、pytestのキャッシュ（.pytest_cache）に保存します。
+
+    キーはファイルの内容とcrules.utilsのソースのハッシュなので、一時ディレクトリの
+    パスが実行ごとに変わっても、内容とパーサーが同じなら次回以降の実行ではパースしません。
+
+    Args:
+        cache: pytestのcacheフィクスチャ（cacheproviderが無効な場合はNone）
+        path: マークダウンファイルのパス
+
+    Returns:
+        Any: read_yaml_front_matterの結果
+    """
+    if cache is None:
+        return utils.read_yaml_front_matter(path)
+
+    digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    key = f"crules/frontmatter/{_PARSER_DIGEST}-{digest}"
+    entry = cache.get(key, None)
+    if entry is None:
+        entry = {"front_matter": utils.read_yaml_front_matter(path)}
+        cache.set(key, entry)
+    return entry["front_matter"]
+
+
+def _mkdirs(root: Path, rels) -> None:
+    """root配下に相対パスのディレクトリをまとめて作成します。"""
+    for rel in rels:
+        (root / rel).mkdir(parents=True, exist_ok=True)
+
+
+def clone_tree(src: Path, dst: Path) -> None:
+    """
+    srcのディレクトリ構造をdstに再現し、ファイルはハードリンクで共有します。
+
+    リンクされたファイルを書き換えると元のファイルも変更されるため、
+    既存のファイルを書き換えるテストではshutil.copytreeを使用してください。
+    ファイルの追加や削除は元のファイルに影響しません。
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    for p in sorted(src.rglob("*")):
+        target = dst / p.relative_to(src)
+        if p.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            os.link(p, target)
+
+
+@pytest.fixture(scope="session")
+def _template_blueprint(tmp_path_factory):
+    """テンプレートディレクトリの雛形をセッションで一度だけ作成するフィクスチャ"""
+    project_dir = tmp_path_factory.mktemp("blueprint")
+
+    # アプリケーションテンプレートを作成
+    app_template = project_dir / "template" / "app"
+
+    # ルールディレクトリを作成
+    rules_dir = app_template / "rules"
+    rules_dir.mkdir(parents=True)
+
+    # サンプルルールファイルを作成
+    rule_content = """---
+description: "Test rule"
+globs: "src/**/*.ts"
+alwaysApply: false
+---
+
+# Test Rule
+This is a test rule.
+"""
+    (rules_dir / "test_rule.md").write_text(rule_content)
+
+    # ノートディレクトリを作成
+    notes_dir = app_template / "notes"
+    notes_dir.mkdir()
+
+    # サンプルノートファイルを作成
+    note_content = """---
+description: "Test note"
+category: "development"
+---
+
+# Test Note
+This is a test note.
+"""
+    (notes_dir / "test_note.md").write_text(note_content)
+
+    return project_dir
+
+
+def _create_project(blueprint: Path, project_dir: Path) -> Path:
+    """雛形をコピーし、ターゲットディレクトリを作成します。"""
+    shutil.copytree(blueprint, project_dir, dirs_exist_ok=True)
+
+    # ターゲットディレクトリを作成
+    target_dir = project_dir / ".cursor" / "rules"
+    target_dir.mkdir(parents=True)
+
+    notes_target_dir = project_dir / ".notes"
+    notes_target_dir.mkdir()
+
+    return project_dir
+
+
+@pytest.fixture
+def temp_project(tmp_path, _template_blueprint):
+    """一時的なプロジェクトディレクトリを作成するフィクスチャ"""
+    # 雛形をテストごとにコピーし、変更がテスト間で共有されないようにする
+    return _create_project(_template_blueprint, tmp_path / "test_project")
+
+
+@pytest.fixture
+def project_base(temp_project):
+    """カレントディレクトリを変更せずに、utilsのbase引数に渡すプロジェクトディレクトリを返すフィクスチャ"""
+    return str(temp_project)
+
+
+@pytest.fixture
+def change_to_project_dir(temp_project, monkeypatch):
+    """プロジェクトディレクトリに移動するフィクスチャ"""
+    monkeypatch.chdir(temp_project)
+
+
+@pytest.fixture(scope="session")
+def _template_projects(tmp_path_factory):
+    """テンプレートプロジェクトをファイルの組み合わせごとにセッションで一度だけ作成するフィクスチャ"""
+    projects = {}
+
+    def build(template_files) -> Path:
+        key = tuple(template_files)
+        if key not in projects:
+            template_dir = tmp_path_factory.mktemp("template_project")
+            _mkdirs(template_dir, sorted({os.path.dirname(rel) for rel, _ in key}))
+            for rel, txt in key:
+                (template_dir / rel).write_text(txt)
+            projects[key] = template_dir
+        return projects[key]
+
+    return build
+
+
+@pytest.fixture
+def template_project(request, _template_projects):
+    """
+    テストモジュールのTEMPLATE_FILESからテンプレートプロジェクトの構造を作成
+
+    同じTEMPLATE_FILESを使うテストの間で共有されるため、変更するテストでは
+    template_project_rwを使用してください。
+    """
+    return _template_projects(request.module.TEMPLATE_FILES)
+
+
+@pytest.fixture
+def template_project_rw(template_project, tmp_path):
+    """テストごとに変更可能なテンプレートプロジェクトのコピーを作成"""
+    template_dir = tmp_path / "template"
+    shutil.copytree(template_project, template_dir)
+    return template_dir
+
+
+@pytest.fixture
+def template_project_linked(template_project, tmp_path):
+    """既存のファイルを書き換えないテスト用に、テンプレートプロジェクトをハードリンクで複製"""
+    template_dir = tmp_path / "template"
+    clone_tree(template_project, template_dir)
+    return template_dir
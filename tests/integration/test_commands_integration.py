@@ -1,4 +1,3 @@
-import os
 import shutil
 from pathlib import Path
 
@@ -12,70 +11,7 @@ from crules.commands import (
     validate_command,
 )
 
-
-# テスト用のフィクスチャ
-@pytest.fixture
-def temp_project(tmp_path):
-    """一時的なプロジェクトディレクトリを作成するフィクスチャ"""
-    project_dir = tmp_path / "test_project"
-    project_dir.mkdir()
-
-    # テンプレートディレクトリを作成
-    template_dir = project_dir / "template"
-    template_dir.mkdir()
-
-    # アプリケーションテンプレートを作成
-    app_template = template_dir / "app"
-    app_template.mkdir()
-
-    # ルールディレクトリを作成
-    rules_dir = app_template / "rules"
-    rules_dir.mkdir()
-
-    # サンプルルールファイルを作成
-    rule_content = """---
-description: "Test rule"
-globs: "src/**/*.ts"
-alwaysApply: false
----
-
-# Test Rule
-This is a test rule.
-"""
-    (rules_dir / "test_rule.md").write_text(rule_content)
-
-    # ノートディレクトリを作成
-    notes_dir = app_template / "notes"
-    notes_dir.mkdir()
-
-    # サンプルノートファイルを作成
-    note_content = """---
-description: "Test note"
-category: "development"
----
-
-# Test Note
-This is a test note.
-"""
-    (notes_dir / "test_note.md").write_text(note_content)
-
-    # ターゲットディレクトリを作成
-    target_dir = project_dir / ".cursor" / "rules"
-    target_dir.mkdir(parents=True)
-
-    notes_target_dir = project_dir / ".notes"
-    notes_target_dir.mkdir()
-
-    return project_dir
-
-
-@pytest.fixture
-def change_to_project_dir(temp_project):
-    """プロジェクトディレクトリに移動するフィクスチャ"""
-    original_dir = os.getcwd()
-    os.chdir(temp_project)
-    yield
-    os.chdir(original_dir)
+pytestmark = pytest.mark.integration
 
 
 # 統合テスト
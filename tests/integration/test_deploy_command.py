@@ -17,92 +17,60 @@ from crules.commands import deploy_command
 from crules.exceptions import FileOperationError
 from crules.utils import ensure_directory
 
+from .conftest import _mkdirs
 
-@pytest.fixture
-def template_project(tmp_path):
-    """テンプレートプロジェクトの構造を作成"""
-    template_dir = tmp_path / "template"
-    template_dir.mkdir()
-    
-    # ルールディレクトリ
-    rules_dir = template_dir / "app" / "rules"
-    rules_dir.mkdir(parents=True)
-    
-    # ルールファイル1
-    rule1 = rules_dir / "rule1.md"
-    rule1.write_text("""---
+pytestmark = pytest.mark.integration
+
+
+# template_projectフィクスチャが作成するファイル（相対パス, 内容）
+TEMPLATE_FILES = [
+    ("app/rules/rule1.md", """---
 description: ルール1の説明
 globs: []
 alwaysApply: false
 ---
 # ルール1
 ルール1の内容
-""")
-    
-    # ルールファイル2
-    rule2 = rules_dir / "rule2.md"
-    rule2.write_text("""---
+"""),
+    ("app/rules/rule2.md", """---
 description: ルール2の説明
 globs: []
 alwaysApply: false
 ---
 # ルール2
 ルール2の内容
-""")
-    
-    # ネストされたルールディレクトリ
-    nested_rules_dir = rules_dir / "nested"
-    nested_rules_dir.mkdir(parents=True)
-    
-    # ネストされたルールファイル
-    nested_rule = nested_rules_dir / "nested_rule.md"
-    nested_rule.write_text("""---
+"""),
+    ("app/rules/nested/nested_rule.md", """---
 description: ネストされたルールの説明
 globs: []
 alwaysApply: true
 ---
 # ネストされたルール
 ネストされたルールの内容
-""")
-    
-    # ノートディレクトリ
-    notes_dir = template_dir / "app" / "notes"
-    notes_dir.mkdir(parents=True)
-    
-    # ノートファイル1
-    note1 = notes_dir / "note1.md"
-    note1.write_text("""---
+"""),
+    ("app/notes/note1.md", """---
 description: ノート1の説明
 ---
 # ノート1
 ノート1の内容
-""")
-    
-    # ノートファイル2
-    note2 = notes_dir / "note2.md"
-    note2.write_text("""---
+"""),
+    ("app/notes/note2.md", """---
 description: ノート2の説明
 ---
 # ノート2
 ノート2の内容
-""")
-    
-    return template_dir
+"""),
+]
 
 
 @pytest.fixture
 def target_project(tmp_path):
     """ターゲットプロジェクトの構造を作成"""
     target_dir = tmp_path / "target"
-    target_dir.mkdir()
-    
-    # .cursorディレクトリ
-    cursor_dir = target_dir / ".cursor"
-    cursor_dir.mkdir()
+    _mkdirs(target_dir, [".cursor/rules", "notes"])
     
     # rulesディレクトリ
-    rules_dir = cursor_dir / "rules"
-    rules_dir.mkdir()
+    rules_dir = target_dir / ".cursor" / "rules"
     
     # 既存のルールファイル
     existing_rule = rules_dir / "existing_rule.mdc"
@@ -115,10 +83,6 @@ alwaysApply: false
 既存のルールの内容
 """)
     
-    # notesディレクトリ
-    notes_dir = target_dir / "notes"
-    notes_dir.mkdir()
-    
     return target_dir
 
 
@@ -7,6 +7,7 @@ import pytest
 from crules.utils import (
     ensure_directory,
     list_files,
+    place_file,
     read_file,
     read_yaml_front_matter,
     resolve_conflict,
@@ -17,6 +18,8 @@ from crules.utils import (
     write_file,
 )
 
+pytestmark = pytest.mark.integration
+
 
 # テスト用のフィクスチャ
 @pytest.fixture
@@ -52,15 +55,6 @@ This is a test rule.
     return project_dir
 
 
-@pytest.fixture
-def change_to_project_dir(temp_project):
-    """プロジェクトディレクトリに移動するフィクスチャ"""
-    original_dir = os.getcwd()
-    os.chdir(temp_project)
-    yield
-    os.chdir(original_dir)
-
-
 # ファイル操作の統合テスト
 def test_file_read_write_operations(change_to_project_dir):
     """ファイルの読み書き操作をテスト"""
@@ -136,16 +130,48 @@ def test_conflict_resolution(change_to_project_dir):
     with open(target_file, "w") as f:
         f.write("Existing content")
 
-    # 競合を解決
+    # forceなしでは既存のファイルを残す
     source_file = "template/app/rules/test_rule.md"
+    assert resolve_conflict(source_file, target_file) is False
+    assert os.path.exists(target_file)
+
+    # forceを指定すると既存のファイルを削除する
     assert resolve_conflict(source_file, target_file, force=True) is True
+    assert not os.path.exists(target_file)
+
+    # ターゲットが存在しない場合は競合なし
+    assert resolve_conflict(source_file, target_file) is True
 
-    # ファイルが上書きされたことを確認
+    # place_fileで配置すると既存のファイルが上書きされることを確認
+    with open(target_file, "w") as f:
+        f.write("Existing content")
+    assert place_file(source_file, target_file, force=True) is True
     with open(target_file, "r") as f:
         content = f.read()
         assert "Test Rule" in content
 
 
+def test_place_file_unchanged(change_to_project_dir):
+    """変更のないソースのコピーが省略されることをテスト"""
+    target_dir = ".cursor/rules"
+    ensure_directory(target_dir)
+    source_file = "template/app/rules/test_rule.md"
+    target_file = f"{target_dir}/test_rule.mdc"
+    assert place_file(source_file, target_file, force=True) is True
+    assert os.stat(target_file).st_mtime_ns == os.stat(source_file).st_mtime_ns
+
+    # 同じサイズの内容に書き換えた場合、更新時刻がソース以降であればforceなしでは上書きされない
+    with open(target_file, "r+") as f:
+        f.write("X")
+    os.utime(target_file)
+    assert place_file(source_file, target_file) is True
+    assert read_file(target_file).startswith("X")
+
+    # forceを指定した場合は常に上書きされる
+    assert place_file(source_file, target_file, force=True) is True
+    assert read_file(target_file) == read_file(source_file)
+
+
 def test_error_handling(change_to_project_dir):
     """エラーハンドリングをテスト"""
     # 存在しないファイルを読み込む
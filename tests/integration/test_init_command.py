@@ -14,23 +14,11 @@ import pytest
 from crules.commands import init_command
 from crules.exceptions import FileOperationError, ValidationError
 
-@pytest.fixture
-def template_project(tmp_path):
-    """Create a template project structure."""
-    template_dir = tmp_path / "template"
-    
-    # Create template structure
-    app_dir = template_dir / "app"
-    rules_dir = app_dir / "rules"
-    notes_dir = app_dir / "notes"
-    
-    # Create directories
-    for directory in [template_dir, app_dir, rules_dir, notes_dir]:
-        directory.mkdir(parents=True)
-    
-    # Create rule files
-    rule_files = [
-        ("rule1.md", """---
+pytestmark = pytest.mark.integration
+
+# Files created by the template_project fixture as (relative path, content) pairs
+TEMPLATE_FILES = [
+    ("app/rules/rule1.md", """---
 description: "ルール1の説明"
 globs: "src/**/*.ts, src/**/*.tsx"
 alwaysApply: true
@@ -38,52 +26,60 @@ alwaysApply: true
 # ルール1
 ルール1の内容
 """),
-        
-        ("rule2.md", """---
+    ("app/rules/rule2.md", """---
 description: "ルール2の説明"
 globs: "src/**/*.ts, src/**/*.tsx"
 alwaysApply: false
 ---
 # ルール2
 ルール2の内容
-""")
-    ]
-    
-    # Create note files
-    note_files = [
-        ("note1.md", """---
+"""),
+    ("app/notes/note1.md", """---
 description: "ノート1の説明"
 ---
 # ノート1
 ノート1の内容
 """),
-        
-        ("note2.md", """---
+    ("app/notes/note2.md", """---
 description: "ノート2の説明"
 ---
 # ノート2
 ノート2の内容
-""")
-    ]
-    
-    # Write rule files
-    for filename, content in rule_files:
-        file_path = rules_dir / filename
-        file_path.write_text(content)
-    
-    # Write note files
-    for filename, content in note_files:
-        file_path = notes_dir / filename
-        file_path.write_text(content)
-    
-    return template_dir
+"""),
+]
 
-def test_init_command_success(template_project, tmp_path):
-    """Test successful project initialization."""
+# Substrings of each initialized file (init copies the templates verbatim)
+INIT_CONTENT_CASES = [
+    ("app/rules/rule1.md", [
+        'description: "ルール1の説明"',
+        'globs: "src/**/*.ts, src/**/*.tsx"',
+        "alwaysApply: true",
+    ]),
+    ("app/rules/rule2.md", [
+        'description: "ルール2の説明"',
+        'globs: "src/**/*.ts, src/**/*.tsx"',
+        "alwaysApply: false",
+    ]),
+    ("app/notes/note1.md", [
+        'description: "ノート1の説明"',
+        "# ノート1",
+    ]),
+    ("app/notes/note2.md", [
+        'description: "ノート2の説明"',
+        "# ノート2",
+    ]),
+]
+
+@pytest.fixture
+def project_after_init(template_project, tmp_path):
+    """Initialize a new project from the template project."""
     project_dir = tmp_path / "new_project"
-    
-    # Execute init command
     init_command(project_dir, template_project)
+    return project_dir
+
+def test_init_command_success(project_after_init):
+    """Test successful project initialization."""
+    project_dir = project_after_init
     
     # Check if project directory was created
     assert project_dir.exists()
@@ -101,41 +97,19 @@ def test_init_command_success(template_project, tmp_path):
     rule_files = list(rules_dir.glob("*.md"))
     assert len(rule_files) == 2
     
-    # Check specific rule files
-    rule1_path = rules_dir / "rule1.md"
-    rule2_path = rules_dir / "rule2.md"
-    assert rule1_path.exists()
-    assert rule2_path.exists()
-    
-    # Check rule content
-    rule1_content = rule1_path.read_text()
-    assert 'description: "ルール1の説明"' in rule1_content
-    assert "globs: src/**/*.ts, src/**/*.tsx" in rule1_content
-    assert "alwaysApply: true" in rule1_content
-    
-    rule2_content = rule2_path.read_text()
-    assert 'description: "ルール2の説明"' in rule2_content
-    assert "globs: src/**/*.ts, src/**/*.tsx" in rule2_content
-    assert "alwaysApply: false" in rule2_content
-    
     # Check note files
     note_files = list(notes_dir.glob("*.md"))
     assert len(note_files) == 2
-    
-    # Check specific note files
-    note1_path = notes_dir / "note1.md"
-    note2_path = notes_dir / "note2.md"
-    assert note1_path.exists()
-    assert note2_path.exists()
-    
-    # Check note content
-    note1_content = note1_path.read_text()
-    assert 'description: "ノート1の説明"' in note1_content
-    assert "alwaysApply: false" in note1_content
-    
-    note2_content = note2_path.read_text()
-    assert 'description: "ノート2の説明"' in note2_content
-    assert "alwaysApply: true" in note2_content
+
+@pytest.mark.parametrize("rel, expected", INIT_CONTENT_CASES)
+def test_init_command_content(project_after_init, rel, expected):
+    """Test the content of each initialized file."""
+    path = project_after_init / rel
+    assert path.exists()
+    
+    content = path.read_text()
+    for s in expected:
+        assert s in content
 
 def test_init_command_missing_template(template_project, tmp_path):
     """Test initialization with missing template directory."""
@@ -189,12 +163,12 @@ def test_init_command_existing_project(template_project, tmp_path):
     note_files = list(notes_dir.glob("*.md"))
     assert len(note_files) == 2
 
-def test_init_command_nested_directories(template_project, tmp_path):
+def test_init_command_nested_directories(template_project_rw, tmp_path):
     """Test initialization with nested directories in template."""
     project_dir = tmp_path / "nested_project"
     
     # Create nested directory in template
-    nested_dir = template_project / "app" / "rules" / "nested"
+    nested_dir = template_project_rw / "app" / "rules" / "nested"
     nested_dir.mkdir(parents=True)
     
     # Create nested rule file
@@ -209,7 +183,7 @@ alwaysApply: true
 """)
     
     # Execute init command
-    init_command(project_dir, template_project)
+    init_command(project_dir, template_project_rw)
     
     # Check if nested directory was created
     target_nested_dir = project_dir / "app" / "rules" / "nested"
@@ -14,20 +14,12 @@ import pytest
 
 from crules.commands import list_command
 
+pytestmark = pytest.mark.integration
 
-@pytest.fixture
-def template_project(tmp_path):
-    """テンプレートプロジェクトの構造を作成"""
-    template_dir = tmp_path / "template"
-    template_dir.mkdir()
-    
-    # ルールディレクトリ
-    rules_dir = template_dir / "rules"
-    rules_dir.mkdir()
-    
-    # ルールファイル1
-    rule1 = rules_dir / "rule1.md"
-    rule1.write_text("""---
+
+# template_projectフィクスチャが作成するファイル（相対パス, 内容）
+TEMPLATE_FILES = [
+    ("rules/rule1.md", """---
 title: "ルール1"
 description: "ルール1の説明"
 globs: src/**/*.ts
@@ -36,11 +28,8 @@ tags: ["typescript"]
 ---
 # ルール1
 ルール1の内容
-""")
-    
-    # ルールファイル2
-    rule2 = rules_dir / "rule2.md"
-    rule2.write_text("""---
+"""),
+    ("rules/rule2.md", """---
 title: "ルール2"
 description: "ルール2の説明"
 globs: src/**/*.tsx
@@ -49,35 +38,24 @@ tags: ["react"]
 ---
 # ルール2
 ルール2の内容
-""")
-    
-    # ノートディレクトリ
-    notes_dir = template_dir / "notes"
-    notes_dir.mkdir()
-    
-    # ノートファイル1
-    note1 = notes_dir / "note1.md"
-    note1.write_text("""---
+"""),
+    ("notes/note1.md", """---
 title: "ノート1"
 description: "ノート1の説明"
 tags: ["documentation"]
 ---
 # ノート1
 ノート1の内容
-""")
-    
-    # ノートファイル2
-    note2 = notes_dir / "note2.md"
-    note2.write_text("""---
+"""),
+    ("notes/note2.md", """---
 title: "ノート2"
 description: "ノート2の説明"
 tags: ["guide"]
 ---
 # ノート2
 ノート2の内容
-""")
-    
-    return template_dir
+"""),
+]
 
 
 def test_list_command_success(template_project):
@@ -120,23 +98,23 @@ def test_list_command_missing_template(tmp_path):
     assert result["notes"] == []
 
 
-def test_list_command_missing_directories(template_project):
+def test_list_command_missing_directories(template_project_rw):
     """ルールとノートのディレクトリが存在しない場合の処理を確認"""
     # ディレクトリを削除
-    shutil.rmtree(template_project / "rules")
-    shutil.rmtree(template_project / "notes")
+    shutil.rmtree(template_project_rw / "rules")
+    shutil.rmtree(template_project_rw / "notes")
     
-    result = list_command(str(template_project))
+    result = list_command(str(template_project_rw))
     
     # 空のリストが返されることを確認
     assert result["rules"] == []
     assert result["notes"] == []
 
 
-def test_list_command_invalid_files(template_project):
+def test_list_command_invalid_files(template_project_rw):
     """無効なファイルの処理を確認"""
     # 無効なルールファイルを作成
-    invalid_rule = template_project / "rules" / "invalid_rule.md"
+    invalid_rule = template_project_rw / "rules" / "invalid_rule.md"
     invalid_rule.write_text("""---
 title: "無効なルール"
 description: "無効なルールの説明"
@@ -149,7 +127,7 @@ tags: ["invalid"]
 """)
     
     # 無効なノートファイルを作成
-    invalid_note = template_project / "notes" / "invalid_note.md"
+    invalid_note = template_project_rw / "notes" / "invalid_note.md"
     invalid_note.write_text("""---
 title: "無効なノート"
 description: "無効なノートの説明"
@@ -159,7 +137,7 @@ tags: ["invalid"]
 無効なノートの内容
 """)
     
-    result = list_command(str(template_project))
+    result = list_command(str(template_project_rw))
     
     # 無効なファイルは除外されることを確認
     assert len(result["rules"]) == 2
@@ -168,10 +146,10 @@ tags: ["invalid"]
     assert not any(note["title"] == "無効なノート" for note in result["notes"])
 
 
-def test_list_command_nested_directories(template_project):
+def test_list_command_nested_directories(template_project_rw):
     """ネストされたディレクトリの処理を確認"""
     # ネストされたルールディレクトリを作成
-    nested_rules_dir = template_project / "rules" / "nested"
+    nested_rules_dir = template_project_rw / "rules" / "nested"
     nested_rules_dir.mkdir()
     
     # ネストされたルールファイルを作成
@@ -187,7 +165,7 @@ tags: ["typescript"]
 ネストされたルールの内容
 """)
     
-    result = list_command(str(template_project))
+    result = list_command(str(template_project_rw))
     
     # ネストされたルールが含まれることを確認
     assert len(result["rules"]) == 3
@@ -8,9 +8,9 @@ from crules.exceptions import ConfigurationError, FileOperationError, Validation
 from crules.utils import (
     ensure_directory,
     list_files,
+    place_file,
     read_file,
     read_yaml_front_matter,
-    resolve_conflict,
     validate_file_content,
     validate_file_format,
     validate_file_size,
@@ -18,6 +18,19 @@ from crules.utils import (
     write_file,
 )
 
+pytestmark = pytest.mark.integration
+
+# 一覧表示テストで作成するファイルの内容（%sに名前を埋め込む）
+_NOTE_TEMPLATE = b"""---
+description: "%s"
+globs: "src/**/*.ts"
+alwaysApply: false
+---
+
+# %s
+This is %s.
+"""
+
 
 # テスト用のフィクスチャ
 @pytest.fixture
@@ -53,17 +66,8 @@ This is a test note.
     return project_dir
 
 
-@pytest.fixture
-def change_to_project_dir(temp_project):
-    """プロジェクトディレクトリに移動するフィクスチャ"""
-    original_dir = os.getcwd()
-    os.chdir(temp_project)
-    yield
-    os.chdir(original_dir)
-
-
 # ノートの配置テスト
-def test_note_placement(change_to_project_dir):
+def test_note_placement(project_base):
     """ノートの配置機能をテスト"""
     # ノートを配置
     source_file = "template/app/notes/test_note.md"
@@ -71,28 +75,32 @@ def test_note_placement(change_to_project_dir):
     target_file = f"{target_dir}/test_note.mdc"
 
     # ターゲットディレクトリを作成
-    ensure_directory(target_dir)
+    ensure_directory(target_dir, base=project_base)
 
     # ノートを配置
-    resolve_conflict(source_file, target_file, force=True)
+    place_file(source_file, target_file, force=True, base=project_base)
 
     # 配置されたファイルを確認
-    assert os.path.exists(target_file)
-    assert read_file(target_file) == read_file(source_file)
+    assert os.path.exists(os.path.join(project_base, target_file))
+    assert read_file(target_file, base=project_base) == read_file(
+        source_file, base=project_base
+    )
 
 
-def test_note_validation(change_to_project_dir):
+def test_note_validation(project_base):
     """ノートの検証機能をテスト"""
     # 有効なノートファイル
     valid_note = "template/app/notes/test_note.md"
-    assert validate_file_format(valid_note, [".md"])
-    assert validate_file_size(valid_note, 1024 * 1024)
-    assert validate_file_content(valid_note, ["description", "globs", "alwaysApply"])
-    assert validate_file_structure(valid_note)
+    assert validate_file_format(valid_note, [".md"], base=project_base)
+    assert validate_file_size(valid_note, 1024 * 1024, base=project_base)
+    assert validate_file_content(
+        valid_note, ["description", "globs", "alwaysApply"], base=project_base
+    )
+    assert validate_file_structure(valid_note, base=project_base)
 
     # 無効なノートファイルを作成
     invalid_note = "template/app/notes/invalid_note.md"
-    with open(invalid_note, "w") as f:
+    with open(os.path.join(project_base, invalid_note), "w") as f:
         f.write(
             """---
 description: "Invalid note"
@@ -107,12 +115,12 @@ Invalid alwaysApply value.
 
     # 無効なノートを検証
     assert not validate_file_content(
-        invalid_note, ["description", "globs", "alwaysApply"]
+        invalid_note, ["description", "globs", "alwaysApply"], base=project_base
     )
-    assert not validate_file_structure(invalid_note)
+    assert not validate_file_structure(invalid_note, base=project_base)
 
 
-def test_note_listing(change_to_project_dir):
+def test_note_listing(project_base):
     """ノートの一覧表示機能をテスト"""
     # 複数のノートファイルを作成
     notes = [
@@ -122,37 +130,27 @@ def test_note_listing(change_to_project_dir):
     ]
 
     for filename, content in notes:
-        filepath = f"template/app/notes/{filename}"
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, "w") as f:
-            f.write(
-                f"""---
-description: "{content}"
-globs: "src/**/*.ts"
-alwaysApply: false
----
-
-# {content}
-This is {content}.
-"""
-            )
+        filepath = Path(project_base, "template/app/notes", filename)
+        ensure_directory(filepath.parent)
+        name = content.encode()
+        filepath.write_bytes(_NOTE_TEMPLATE % (name, name, name))
 
     # ノートファイルを列挙
-    note_files = list_files("template/app/notes")
+    note_files = list_files("template/app/notes", base=project_base)
     assert len(note_files) == 4  # test_note.md + 3 new notes
 
     # サブディレクトリのノートも含まれていることを確認
     assert any(f.endswith("subdir/note3.md") for f in note_files)
 
 
-def test_note_update(change_to_project_dir):
+def test_note_update(project_base):
     """ノートの更新機能をテスト"""
     # ノートを配置
     source_file = "template/app/notes/test_note.md"
     target_dir = ".cursor/notes"
     target_file = f"{target_dir}/test_note.mdc"
-    ensure_directory(target_dir)
-    resolve_conflict(source_file, target_file, force=True)
+    ensure_directory(target_dir, base=project_base)
+    place_file(source_file, target_file, force=True, base=project_base)
 
     # ノートを更新
     updated_content = """---
@@ -164,30 +162,30 @@ alwaysApply: true
 # Updated Test Note
 This is an updated test note.
 """
-    with open(source_file, "w") as f:
+    with open(os.path.join(project_base, source_file), "w") as f:
         f.write(updated_content)
 
     # 更新を適用
-    resolve_conflict(source_file, target_file, force=True)
+    place_file(source_file, target_file, force=True, base=project_base)
 
     # 更新された内容を確認
-    assert read_file(target_file) == updated_content
+    assert read_file(target_file, base=project_base) == updated_content
 
 
-def test_note_deletion(change_to_project_dir):
+def test_note_deletion(project_base):
     """ノートの削除機能をテスト"""
     # ノートを配置
     source_file = "template/app/notes/test_note.md"
     target_dir = ".cursor/notes"
     target_file = f"{target_dir}/test_note.mdc"
-    ensure_directory(target_dir)
-    resolve_conflict(source_file, target_file, force=True)
+    ensure_directory(target_dir, base=project_base)
+    place_file(source_file, target_file, force=True, base=project_base)
 
     # ノートを削除
-    os.remove(target_file)
+    os.remove(os.path.join(project_base, target_file))
 
     # 削除されたことを確認
-    assert not os.path.exists(target_file)
+    assert not os.path.exists(os.path.join(project_base, target_file))
 
     # テンプレートのノートは残っていることを確認
-    assert os.path.exists(source_file)
+    assert os.path.exists(os.path.join(project_base, source_file))
@@ -8,9 +8,9 @@ from crules.exceptions import ConfigurationError, FileOperationError, Validation
 from crules.utils import (
     ensure_directory,
     list_files,
+    place_file,
     read_file,
     read_yaml_front_matter,
-    resolve_conflict,
     validate_file_content,
     validate_file_format,
     validate_file_size,
@@ -18,6 +18,19 @@ from crules.utils import (
     write_file,
 )
 
+pytestmark = pytest.mark.integration
+
+# 一覧表示テストで作成するファイルの内容（%sに名前を埋め込む）
+_RULE_TEMPLATE = b"""---
+description: "%s"
+globs: "src/**/*.ts"
+alwaysApply: false
+---
+
+# %s
+This is %s.
+"""
+
 
 # テスト用のフィクスチャ
 @pytest.fixture
@@ -53,17 +66,8 @@ This is a test rule.
     return project_dir
 
 
-@pytest.fixture
-def change_to_project_dir(temp_project):
-    """プロジェクトディレクトリに移動するフィクスチャ"""
-    original_dir = os.getcwd()
-    os.chdir(temp_project)
-    yield
-    os.chdir(original_dir)
-
-
 # ルールの配置テスト
-def test_rule_placement(change_to_project_dir):
+def test_rule_placement(project_base):
     """ルールの配置機能をテスト"""
     # ルールを配置
     source_file = "template/app/rules/test_rule.md"
@@ -71,28 +75,32 @@ def test_rule_placement(change_to_project_dir):
     target_file = f"{target_dir}/test_rule.mdc"
 
     # ターゲットディレクトリを作成
-    ensure_directory(target_dir)
+    ensure_directory(target_dir, base=project_base)
 
     # ルールを配置
-    resolve_conflict(source_file, target_file, force=True)
+    place_file(source_file, target_file, force=True, base=project_base)
 
     # 配置されたファイルを確認
-    assert os.path.exists(target_file)
-    assert read_file(target_file) == read_file(source_file)
+    assert os.path.exists(os.path.join(project_base, target_file))
+    assert read_file(target_file, base=project_base) == read_file(
+        source_file, base=project_base
+    )
 
 
-def test_rule_validation(change_to_project_dir):
+def test_rule_validation(project_base):
     """ルールの検証機能をテスト"""
     # 有効なルールファイル
     valid_rule = "template/app/rules/test_rule.md"
-    assert validate_file_format(valid_rule, [".md"])
-    assert validate_file_size(valid_rule, 1024 * 1024)
-    assert validate_file_content(valid_rule, ["description", "globs", "alwaysApply"])
-    assert validate_file_structure(valid_rule)
+    assert validate_file_format(valid_rule, [".md"], base=project_base)
+    assert validate_file_size(valid_rule, 1024 * 1024, base=project_base)
+    assert validate_file_content(
+        valid_rule, ["description", "globs", "alwaysApply"], base=project_base
+    )
+    assert validate_file_structure(valid_rule, base=project_base)
 
     # 無効なルールファイルを作成
     invalid_rule = "template/app/rules/invalid_rule.md"
-    with open(invalid_rule, "w") as f:
+    with open(os.path.join(project_base, invalid_rule), "w") as f:
         f.write(
             """---
 description: "Invalid rule"
@@ -107,12 +115,12 @@ Invalid alwaysApply value.
 
     # 無効なルールを検証
     assert not validate_file_content(
-        invalid_rule, ["description", "globs", "alwaysApply"]
+        invalid_rule, ["description", "globs", "alwaysApply"], base=project_base
     )
-    assert not validate_file_structure(invalid_rule)
+    assert not validate_file_structure(invalid_rule, base=project_base)
 
 
-def test_rule_listing(change_to_project_dir):
+def test_rule_listing(project_base):
     """ルールの一覧表示機能をテスト"""
     # 複数のルールファイルを作成
     rules = [
@@ -122,37 +130,27 @@ def test_rule_listing(change_to_project_dir):
     ]
 
     for filename, content in rules:
-        filepath = f"template/app/rules/{filename}"
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, "w") as f:
-            f.write(
-                f"""---
-description: "{content}"
-globs: "src/**/*.ts"
-alwaysApply: false
----
-
-# {content}
-This is {content}.
-"""
-            )
+        filepath = Path(project_base, "template/app/rules", filename)
+        ensure_directory(filepath.parent)
+        name = content.encode()
+        filepath.write_bytes(_RULE_TEMPLATE % (name, name, name))
 
     # ルールファイルを列挙
-    rule_files = list_files("template/app/rules")
+    rule_files = list_files("template/app/rules", base=project_base)
     assert len(rule_files) == 4  # test_rule.md + 3 new rules
 
     # サブディレクトリのルールも含まれていることを確認
     assert any(f.endswith("subdir/rule3.md") for f in rule_files)
 
 
-def test_rule_update(change_to_project_dir):
+def test_rule_update(project_base):
     """ルールの更新機能をテスト"""
     # ルールを配置
     source_file = "template/app/rules/test_rule.md"
     target_dir = ".cursor/rules"
     target_file = f"{target_dir}/test_rule.mdc"
-    ensure_directory(target_dir)
-    resolve_conflict(source_file, target_file, force=True)
+    ensure_directory(target_dir, base=project_base)
+    place_file(source_file, target_file, force=True, base=project_base)
 
     # ルールを更新
     updated_content = """---
@@ -164,30 +162,30 @@ alwaysApply: true
 # Updated Test Rule
 This is an updated test rule.
 """
-    with open(source_file, "w") as f:
+    with open(os.path.join(project_base, source_file), "w") as f:
         f.write(updated_content)
 
     # 更新を適用
-    resolve_conflict(source_file, target_file, force=True)
+    place_file(source_file, target_file, force=True, base=project_base)
 
     # 更新された内容を確認
-    assert read_file(target_file) == updated_content
+    assert read_file(target_file, base=project_base) == updated_content
 
 
-def test_rule_deletion(change_to_project_dir):
+def test_rule_deletion(project_base):
     """ルールの削除機能をテスト"""
     # ルールを配置
     source_file = "template/app/rules/test_rule.md"
     target_dir = ".cursor/rules"
     target_file = f"{target_dir}/test_rule.mdc"
-    ensure_directory(target_dir)
-    resolve_conflict(source_file, target_file, force=True)
+    ensure_directory(target_dir, base=project_base)
+    place_file(source_file, target_file, force=True, base=project_base)
 
     # ルールを削除
-    os.remove(target_file)
+    os.remove(os.path.join(project_base, target_file))
 
     # 削除されたことを確認
-    assert not os.path.exists(target_file)
+    assert not os.path.exists(os.path.join(project_base, target_file))
 
     # テンプレートのルールは残っていることを確認
-    assert os.path.exists(source_file)
+    assert os.path.exists(os.path.join(project_base, source_file))
@@ -14,20 +14,12 @@ import pytest
 
 from crules.commands import tree_command
 
+pytestmark = pytest.mark.integration
 
-@pytest.fixture
-def template_project(tmp_path):
-    """テンプレートプロジェクトの構造を作成"""
-    template_dir = tmp_path / "template"
-    template_dir.mkdir()
-    
-    # ルールディレクトリ
-    rules_dir = template_dir / "rules"
-    rules_dir.mkdir()
-    
-    # ルールファイル1
-    rule1 = rules_dir / "rule1.md"
-    rule1.write_text("""---
+
+# template_projectフィクスチャが作成するファイル（相対パス, 内容）
+TEMPLATE_FILES = [
+    ("rules/rule1.md", """---
 title: "ルール1"
 description: "ルール1の説明"
 globs: src/**/*.ts
@@ -36,11 +28,8 @@ tags: ["typescript"]
 ---
 # ルール1
 ルール1の内容
-""")
-    
-    # ルールファイル2
-    rule2 = rules_dir / "rule2.md"
-    rule2.write_text("""---
+"""),
+    ("rules/rule2.md", """---
 title: "ルール2"
 description: "ルール2の説明"
 globs: src/**/*.tsx
@@ -49,40 +38,29 @@ tags: ["react"]
 ---
 # ルール2
 ルール2の内容
-""")
-    
-    # ノートディレクトリ
-    notes_dir = template_dir / "notes"
-    notes_dir.mkdir()
-    
-    # ノートファイル1
-    note1 = notes_dir / "note1.md"
-    note1.write_text("""---
+"""),
+    ("notes/note1.md", """---
 title: "ノート1"
 description: "ノート1の説明"
 tags: ["documentation"]
 ---
 # ノート1
 ノート1の内容
-""")
-    
-    # ノートファイル2
-    note2 = notes_dir / "note2.md"
-    note2.write_text("""---
+"""),
+    ("notes/note2.md", """---
 title: "ノート2"
 description: "ノート2の説明"
 tags: ["guide"]
 ---
 # ノート2
 ノート2の内容
-""")
-    
-    return template_dir
+"""),
+]
 
 
-def test_tree_command_success(template_project):
+def test_tree_command_success(template_project_linked):
     """tree_commandが正常に実行されることを確認"""
-    result = tree_command(str(template_project))
+    result = tree_command(str(template_project_linked))
     
     # テンプレートディレクトリの構造を確認
     assert "template" in result
@@ -125,17 +103,17 @@ def test_tree_command_missing_template(tmp_path):
     assert result == {}
 
 
-def test_tree_command_empty_directories(template_project):
+def test_tree_command_empty_directories(template_project_linked):
     """空のディレクトリの処理を確認"""
     # ディレクトリを削除
-    shutil.rmtree(template_project / "rules")
-    shutil.rmtree(template_project / "notes")
+    shutil.rmtree(template_project_linked / "rules")
+    shutil.rmtree(template_project_linked / "notes")
     
     # 空のディレクトリを作成
-    (template_project / "rules").mkdir()
-    (template_project / "notes").mkdir()
+    (template_project_linked / "rules").mkdir()
+    (template_project_linked / "notes").mkdir()
     
-    result = tree_command(str(template_project))
+    result = tree_command(str(template_project_linked))
     
     # 空のディレクトリが含まれることを確認
     assert "template" in result
@@ -145,10 +123,10 @@ def test_tree_command_empty_directories(template_project):
     assert len(result["template"]["notes"]) == 0
 
 
-def test_tree_command_nested_directories(template_project):
+def test_tree_command_nested_directories(template_project_linked):
     """ネストされたディレクトリの処理を確認"""
     # ネストされたルールディレクトリを作成
-    nested_rules_dir = template_project / "rules" / "nested"
+    nested_rules_dir = template_project_linked / "rules" / "nested"
     nested_rules_dir.mkdir()
     
     # ネストされたルールファイルを作成
@@ -164,7 +142,7 @@ tags: ["typescript"]
 ネストされたルールの内容
 """)
     
-    result = tree_command(str(template_project))
+    result = tree_command(str(template_project_linked))
     
     # ネストされたルールが含まれることを確認
     assert "nested" in result["template"]["rules"]
@@ -190,4 +168,36 @@ def test_tree_command_default_template(tmp_path):
     assert "rules" in result[".crules"]["template"]
     assert "notes" in result[".crules"]["template"]
     assert len(result[".crules"]["template"]["rules"]) == 0
-    assert len(result[".crules"]["template"]["notes"]) == 0 
\ No newline at end of file
+    assert len(result[".crules"]["template"]["notes"]) == 0 
+
+def test_tree_command_output(tmp_path):
+    """階層表示と、rules・notes直下の隠しファイル以外のエントリ数が出力されることを確認"""
+    template_dir = tmp_path / "template"
+    (template_dir / "rules" / "sub").mkdir(parents=True)
+    (template_dir / "notes").mkdir()
+    (template_dir / "rules" / "rule1.md").write_text("---\ntitle: ルール1\n---\n")
+    (template_dir / "rules" / "readme.txt").write_text("readme")
+    (template_dir / "rules" / "sub" / "rule2.md").write_text("---\ntitle: ルール2\n---\n")
+    (template_dir / "notes" / "note1.md").write_text("---\ntitle: ノート1\n---\n")
+    (template_dir / ".hidden").write_text("hidden")
+    (template_dir / "rules" / ".keep").write_text("")
+
+    result = tree_command(template_dir)
+
+    assert result.splitlines() == [
+        f"テンプレートディレクトリ: {template_dir}",
+        "└── template",
+        "    ├── notes",
+        "    │   └── note1.md",
+        "    ├── rules",
+        "    │   ├── sub",
+        "    │   │   └── rule2.md",
+        "    │   ├── .keep",
+        "    │   ├── readme.txt",
+        "    │   └── rule1.md",
+        "    └── .hidden",
+        "",
+        "詳細情報:",
+        "ルールファイル数: 3",
+        "ノートファイル数: 1",
+    ]
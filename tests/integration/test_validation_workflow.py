@@ -10,37 +10,25 @@ of the validation system, including:
 """
 
 import os
-import shutil
 from pathlib import Path
 import pytest
 from crules.validator import FileValidator
-from crules.utils import read_yaml_front_matter, validate_file_content, ensure_directory
 
-@pytest.fixture
-def test_project(tmp_path):
-    """Create a test project structure."""
-    project_dir = tmp_path / "test_project"
-    
-    # Create project structure
-    template_dir = project_dir / "template"
-    app_dir = template_dir / "app"
-    rules_dir = app_dir / "rules"
-    
-    # Create directories
-    for directory in [template_dir, app_dir, rules_dir]:
-        directory.mkdir(parents=True)
-    
-    # Create valid rule files
-    valid_rules = [
-        ("basic_rule.md", """---
+from .conftest import cached_frontmatter
+
+pytestmark = pytest.mark.integration
+
+# Rule files created by the test_project fixture: (filename, content)
+VALID_RULES = [
+    ("basic_rule.md", """---
 title: Basic Rule
 description: A basic validation rule
 tags: [validation, basic]
 severity: error
 ---
 This is a basic validation rule."""),
-        
-        ("complex_rule.md", """---
+
+    ("complex_rule.md", """---
 title: Complex Rule
 description: A complex validation rule with multiple tags
 tags: [validation, complex, multiple]
@@ -58,32 +46,53 @@ examples:
       }
 ---
 This is a complex validation rule with examples.""")
-    ]
-    
-    # Create invalid rule files
-    invalid_rules = [
-        ("missing_fields.md", """---
+]
+
+INVALID_RULES = [
+    ("missing_fields.md", """---
 title: Missing Fields Rule
 ---
 This rule is missing required fields."""),
-        
-        ("invalid_yaml.md", """---
+
+    ("invalid_yaml.md", """---
 title: Invalid YAML
 description: [Missing bracket
 tags: [test
 severity: error
 ---
 This file has invalid YAML front matter."""),
-        
-        ("no_front_matter.md", """
+
+    ("no_front_matter.md", """
 This file has no front matter at all.""")
-    ]
-    
-    # Write all files
-    for filename, content in valid_rules + invalid_rules:
-        file_path = rules_dir / filename
-        file_path.write_text(content)
-    
+]
+
+# Encoded once at import so the fixture only has to write bytes: {filename: content}
+_CORPUS = {
+    filename: content.encode("utf-8")
+    for filename, content in VALID_RULES + INVALID_RULES
+}
+
+@pytest.fixture(scope="module")
+def test_project(tmp_path_factory):
+    """Create a test project structure shared by the tests in this module.
+
+    Tests that add files to the project must remove them again.
+    """
+    project_dir = tmp_path_factory.mktemp("validation_workflow") / "test_project"
+    rules_dir = os.path.join(project_dir, "template", "app", "rules")
+    os.makedirs(rules_dir)
+
+    for filename, data in _CORPUS.items():
+        fd = os.open(
+            os.path.join(rules_dir, filename),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o644,
+        )
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
     return project_dir
 
 @pytest.fixture
@@ -91,38 +100,36 @@ def validator():
     """Create a validator with standard rule requirements."""
     return FileValidator(required_fields=["title", "description", "tags", "severity"])
 
+# Fields each invalid rule file is expected to be missing
+MISSING_FIELDS = [
+    ("missing_fields.md", {"description", "tags", "severity"}),
+    ("invalid_yaml.md", {"title", "description", "tags", "severity"}),
+    ("no_front_matter.md", {"title", "description", "tags", "severity"}),
+]
+
 def test_validate_rule_files(test_project, validator):
     """Test validating all rule files in a project."""
     rules_dir = test_project / "template" / "app" / "rules"
     results = validator.validate_directory(rules_dir)
     
-    # Should find 3 invalid files
-    assert len(results) == 3
-    
-    # Check missing_fields.md
-    missing_fields_path = rules_dir / "missing_fields.md"
-    assert missing_fields_path in results
-    assert "description" in results[missing_fields_path]
-    assert "tags" in results[missing_fields_path]
-    assert "severity" in results[missing_fields_path]
-    
-    # Check invalid_yaml.md
-    invalid_yaml_path = rules_dir / "invalid_yaml.md"
-    assert invalid_yaml_path in results
-    assert set(results[invalid_yaml_path]) == {"title", "description", "tags", "severity"}
-    
-    # Check no_front_matter.md
-    no_front_matter_path = rules_dir / "no_front_matter.md"
-    assert no_front_matter_path in results
-    assert set(results[no_front_matter_path]) == {"title", "description", "tags", "severity"}
+    # Should find every invalid file and nothing else
+    assert set(results) == {rules_dir / filename for filename, _ in INVALID_RULES}
+
+@pytest.mark.parametrize("filename, missing", MISSING_FIELDS)
+def test_validate_rule_file_missing_fields(test_project, validator, filename, missing):
+    """Test the missing fields reported for each invalid rule file."""
+    rule_path = test_project / "template" / "app" / "rules" / filename
+    assert set(validator.validate_file(rule_path)) == missing
 
-def test_validate_rule_content(test_project):
+def test_validate_rule_content(test_project, pytestconfig):
     """Test validating the content of specific rule files."""
     rules_dir = test_project / "template" / "app" / "rules"
+    # Parse results are reused across runs through .pytest_cache
+    cache = getattr(pytestconfig, "cache", None)
     
     # Test valid rule
     basic_rule_path = rules_dir / "basic_rule.md"
-    front_matter = read_yaml_front_matter(basic_rule_path)
+    front_matter = cached_frontmatter(cache, basic_rule_path)
     assert front_matter["title"] == "Basic Rule"
     assert front_matter["description"] == "A basic validation rule"
     assert front_matter["tags"] == ["validation", "basic"]
@@ -130,7 +137,7 @@ def test_validate_rule_content(test_project):
     
     # Test complex rule
     complex_rule_path = rules_dir / "complex_rule.md"
-    front_matter = read_yaml_front_matter(complex_rule_path)
+    front_matter = cached_frontmatter(cache, complex_rule_path)
     assert front_matter["title"] == "Complex Rule"
     assert len(front_matter["examples"]) == 2
     assert front_matter["examples"][0]["description"] == "Example 1"
@@ -145,13 +152,7 @@ def test_project_structure(test_project):
     
     # Check file existence
     rules_dir = test_project / "template" / "app" / "rules"
-    expected_files = {
-        "basic_rule.md",
-        "complex_rule.md",
-        "missing_fields.md",
-        "invalid_yaml.md",
-        "no_front_matter.md"
-    }
+    expected_files = set(_CORPUS)
     actual_files = {f.name for f in rules_dir.iterdir()}
     assert expected_files == actual_files
 
@@ -159,55 +160,71 @@ def test_error_handling(test_project, validator):
     """Test error handling in the validation workflow."""
     rules_dir = test_project / "template" / "app" / "rules"
     
-    # Test handling of unreadable file
-    unreadable_file = rules_dir / "unreadable.md"
-    unreadable_file.write_text("Some content")
-    os.chmod(unreadable_file, 0o000)
-    
-    results = validator.validate_file(unreadable_file)
-    assert set(results) == {"title", "description", "tags", "severity"}
-    
     # Test handling of nonexistent file
     nonexistent_file = rules_dir / "nonexistent.md"
     results = validator.validate_file(nonexistent_file)
     assert set(results) == {"title", "description", "tags", "severity"}
-    
-    # Cleanup
-    os.chmod(unreadable_file, 0o666)
-    unreadable_file.unlink()
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="file permissions are not enforced for root or on this platform",
+)
+def test_unreadable_file(validator, tmp_path):
+    """Test that a valid rule file that cannot be read is reported as invalid."""
+    content = _CORPUS["basic_rule.md"]
+
+    # The same content is valid when the file can be read
+    readable_file = tmp_path / "readable.md"
+    readable_file.write_bytes(content)
+    assert validator.validate_file(readable_file) == []
+
+    # Kept out of the shared project so other tests never see it
+    unreadable_file = tmp_path / "unreadable.md"
+    unreadable_file.write_bytes(content)
+    os.chmod(unreadable_file, 0o000)
+    try:
+        results = validator.validate_file(unreadable_file)
+    finally:
+        os.chmod(unreadable_file, 0o644)
+    assert set(results) == {"title", "description", "tags", "severity"}
 
 def test_directory_operations(test_project, validator):
     """Test directory-related operations in the validation workflow."""
     rules_dir = test_project / "template" / "app" / "rules"
-    
-    # Test nested directory validation
     nested_dir = rules_dir / "nested"
-    nested_dir.mkdir()
-    
     nested_file = nested_dir / "nested_rule.md"
-    nested_file.write_text("""---
+    symlink_file = rules_dir / "symlink_rule.md"
+    
+    try:
+        # Test nested directory validation
+        nested_dir.mkdir()
+        
+        nested_file.write_text("""---
 title: Nested Rule
 description: A rule in a nested directory
 tags: [nested]
 severity: warning
 ---
 This is a nested rule.""")
-    
-    results = validator.validate_directory(rules_dir)
-    assert len(results) == 3  # Original 3 invalid files
-    assert nested_file not in results  # Nested file is valid
-    
-    # Test symlink handling
-    symlink_file = rules_dir / "symlink_rule.md"
-    os.symlink(nested_file, symlink_file)
-    
-    results = validator.validate_directory(rules_dir)
-    assert len(results) == 3  # Symlink to valid file should not affect count
-    assert symlink_file not in results
-    
-    # Cleanup
-    symlink_file.unlink()
-    shutil.rmtree(nested_dir)
+        
+        results = validator.validate_directory(rules_dir)
+        assert len(results) == len(INVALID_RULES)  # Original invalid files
+        assert nested_file not in results  # Nested file is valid
+        
+        # Test symlink handling
+        os.symlink(nested_file, symlink_file)
+        
+        results = validator.validate_directory(rules_dir)
+        # Symlink to valid file should not affect count
+        assert len(results) == len(INVALID_RULES)
+        assert symlink_file not in results
+    finally:
+        # Leave the shared project as it was
+        if symlink_file.is_symlink():
+            symlink_file.unlink()
+        nested_file.unlink(missing_ok=True)
+        if nested_dir.is_dir():
+            nested_dir.rmdir()
 
 def test_bulk_validation(test_project, validator):
     """Test bulk validation of multiple files."""
@@ -215,13 +232,12 @@ def test_bulk_validation(test_project, validator):
     
     # Get all markdown files
     rule_files = list(rules_dir.glob("*.md"))
-    assert len(rule_files) == 5  # Total number of test files
+    assert len(rule_files) == len(VALID_RULES) + len(INVALID_RULES)
     
     # Validate all files at once
     results = validator.validate_files(rule_files)
-    assert len(results) == 3  # Number of invalid files
+    assert len(results) == len(INVALID_RULES)
     
     # Check that valid files are not in results
-    valid_files = ["basic_rule.md", "complex_rule.md"]
-    for filename in valid_files:
+    for filename, _ in VALID_RULES:
         assert rules_dir / filename not in results 
\ No newline at end of file
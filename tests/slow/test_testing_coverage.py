@@ -0,0 +1,37 @@
+"""
+実際にpytestとcoverageを実行するテスト
+
+時間がかかるため、既定では実行しません（-m slowで実行）。これらのテストはserialマーカーを
+付けており、pytest-xdistで--dist=loadgroupを指定した場合は同じワーカーで実行されます。
+レポートはカレントディレクトリではなくtmp_pathに書き出します。
+"""
+
+import pytest
+from crules.testing import run_tests
+
+pytestmark = pytest.mark.serial
+
+
+@pytest.mark.slow
+def test_run_tests_with_coverage_end_to_end(tmp_path):
+    """カバレッジ付きのテスト実行のテスト（実際にpytestとcoverageを実行する）"""
+    test_file = tmp_path / "test_sample2.py"
+    test_file.write_text("""
+def test_sample():
+    assert True
+""")
+
+    exit_code = run_tests(
+        test_file,
+        coverage=True,
+        coverage_html=True,
+        coverage_xml=True,
+        coverage_terminal=True,
+        verbose=2,
+        output_dir=tmp_path,
+    )
+    assert exit_code == 0
+
+    # カバレッジレポートファイルの存在を確認
+    assert (tmp_path / "htmlcov").exists()
+    assert (tmp_path / "coverage.xml").exists()
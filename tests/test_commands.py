@@ -3,39 +3,74 @@ from pathlib import Path
 from crules.commands import validate_command
 from crules.exceptions import ValidationError, FileOperationError
 
-def test_validate_command_success(test_env, test_case, test_data):
-    """validate_command関数の正常系テスト"""
-    # テスト用のファイルを作成
-    test_file = test_case / "test.md"
-    test_content = f"""---
-title: {test_data["rule"]["title"]}
-description: {test_data["rule"]["description"]}
-tags: {test_data["rule"]["tags"]}
+# conftest.pyのtest_dataフィクスチャと同じルールのデータ
+RULE = {
+    "title": "Test Rule",
+    "description": "Test Description",
+    "tags": ["test", "example"],
+}
+
+# (ファイル名, 内容, 期待する戻り値)。内容がNoneの場合はファイルを作成しない
+CASES = [
+    # 正常系
+    pytest.param("success.md", f"""---
+title: {RULE["title"]}
+description: {RULE["description"]}
+tags: {RULE["tags"]}
 ---
 
 Test content
-"""
-    test_file.write_text(test_content)
+""", 0, id="success"),
+    # 必須フィールド不足
+    pytest.param("missing_fields.md", f"""---
+title: {RULE["title"]}
+---
 
-    # 検証を実行
-    result = validate_command(test_file)
-    assert result == 0  # 成功
+Test content
+""", 1, id="missing_fields"),
+    # 存在しないファイル
+    pytest.param("nonexistent.md", None, 1, id="nonexistent_file"),
+    # 不正なフロントマター形式（不正なYAML形式）
+    pytest.param("invalid_front_matter.md", f"""---
+title: {RULE["title"]}
+description: "Unclosed quote
+tags: {RULE["tags"]}
+---
+
+Test content
+""", 1, id="invalid_front_matter"),
+    # 空のファイル
+    pytest.param("empty_file.md", "", 1, id="empty_file"),
+    # フロントマターなし
+    pytest.param("no_front_matter.md", f"""# {RULE["title"]}
 
-def test_validate_command_missing_fields(test_env, test_case, test_data):
-    """validate_command関数の必須フィールド不足テスト"""
-    # テスト用のファイルを作成（必須フィールドが不足）
-    test_file = test_case / "test.md"
-    test_content = f"""---
-title: {test_data["rule"]["title"]}
+Test content
+""", 1, id="no_front_matter"),
+    # 空のフロントマター
+    pytest.param("empty_front_matter.md", """---
 ---
 
 Test content
-"""
-    test_file.write_text(test_content)
+""", 1, id="empty_front_matter"),
+]
+
+
+@pytest.fixture(scope="module")
+def cases_dir(tmp_path_factory):
+    """すべてのケースで共有するディレクトリ（ケースごとにファイル名を分ける）"""
+    return tmp_path_factory.mktemp("cmds", numbered=True)
+
+
+@pytest.mark.parametrize("filename, content, expected", CASES)
+def test_validate_command(cases_dir, filename, content, expected):
+    """validate_command関数のテスト"""
+    test_file = cases_dir / filename
+    if content is not None:
+        test_file.write_text(content)
 
     # 検証を実行
     result = validate_command(test_file)
-    assert result == 1  # エラー
+    assert result == expected
 
 def test_validate_command_custom_fields(tmp_path):
     """validate_command関数のカスタムフィールドテスト"""
@@ -54,66 +89,3 @@ Test content
     # カスタムフィールドで検証を実行
     validate_command(test_file, required_fields=["title", "author", "date"])
     # 例外が発生しなければ成功
-
-def test_validate_command_nonexistent_file(test_env, test_case):
-    """validate_command関数の存在しないファイルテスト"""
-    # 存在しないファイルで検証を実行
-    result = validate_command(test_case / "nonexistent.md")
-    assert result == 1  # エラー
-
-def test_validate_command_invalid_front_matter(test_env, test_case, test_data):
-    """validate_command関数の不正なフロントマター形式テスト"""
-    # テスト用のファイルを作成（不正なYAML形式）
-    test_file = test_case / "test.md"
-    test_content = f"""---
-title: {test_data["rule"]["title"]}
-description: "Unclosed quote
-tags: {test_data["rule"]["tags"]}
----
-
-Test content
-"""
-    test_file.write_text(test_content)
-
-    # 検証を実行
-    result = validate_command(test_file)
-    assert result == 1  # エラー
-
-def test_validate_command_empty_file(test_env, test_case):
-    """validate_command関数の空ファイルテスト"""
-    # 空のファイルを作成
-    test_file = test_case / "test.md"
-    test_file.write_text("")
-
-    # 検証を実行
-    result = validate_command(test_file)
-    assert result == 1  # エラー
-
-def test_validate_command_no_front_matter(test_env, test_case, test_data):
-    """validate_command関数のフロントマターなしテスト"""
-    # フロントマターなしのファイルを作成
-    test_file = test_case / "test.md"
-    test_content = f"""# {test_data["rule"]["title"]}
-
-Test content
-"""
-    test_file.write_text(test_content)
-
-    # 検証を実行
-    result = validate_command(test_file)
-    assert result == 1  # エラー
-
-def test_validate_command_empty_front_matter(test_env, test_case):
-    """validate_command関数の空のフロントマターテスト"""
-    # 空のフロントマターを持つファイルを作成
-    test_file = test_case / "test.md"
-    test_content = """---
----
-
-Test content
-"""
-    test_file.write_text(test_content)
-
-    # 検証を実行
-    result = validate_command(test_file)
-    assert result == 1  # エラー 
\ No newline at end of file
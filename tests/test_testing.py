@@ -6,9 +6,8 @@
 
 import os
 import sys
-from pathlib import Path
 import pytest
-from crules.testing import run_tests, run_coverage_report
+from crules.testing import run_tests
 
 def test_run_tests_basic(tmp_path):
     """基本的なテスト実行のテスト"""
@@ -20,47 +19,3 @@ def test_sample():
 
     exit_code = run_tests(test_file, verbose=2)
     assert exit_code == 0
-
-def test_run_tests_with_coverage(tmp_path):
-    """カバレッジ付きのテスト実行のテスト"""
-    test_file = tmp_path / "test_sample2.py"
-    test_file.write_text("""
-def test_sample():
-    assert True
-""")
-
-    exit_code = run_tests(
-        test_file,
-        coverage=True,
-        coverage_report=True,
-        coverage_html=True,
-        coverage_xml=True,
-        coverage_terminal=True,
-        verbose=2
-    )
-    assert exit_code == 0
-
-    # カバレッジレポートファイルの存在を確認
-    assert (Path.cwd() / "htmlcov").exists()
-    assert (Path.cwd() / "coverage.xml").exists()
-
-def test_run_coverage_report(tmp_path):
-    """カバレッジレポート生成のテスト"""
-    test_file = tmp_path / "test_sample3.py"
-    test_file.write_text("""
-def test_sample():
-    assert True
-""")
-
-    exit_code = run_coverage_report(
-        test_file,
-        coverage_html=True,
-        coverage_xml=True,
-        coverage_terminal=True,
-        verbose=2
-    )
-    assert exit_code == 0
-
-    # カバレッジレポートファイルの存在を確認
-    assert (Path.cwd() / "htmlcov").exists()
-    assert (Path.cwd() / "coverage.xml").exists() 
\ No newline at end of file
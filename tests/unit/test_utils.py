@@ -1,17 +1,20 @@
-import os
 from pathlib import Path
 
 import pytest
 
+from crules import utils
 from crules.exceptions import ConflictError, ValidationError
 from crules.utils import (
     ensure_directory,
+    list_files,
+    read_file,
     read_yaml_front_matter,
     validate_file_content,
     validate_file_format,
     validate_file_size,
     validate_file_structure,
     validate_yaml_front_matter,
+    write_file,
 )
 
 
@@ -39,6 +42,16 @@ This is a test file.
     return file_path
 
 
+@pytest.fixture(scope="module")
+def valid_content_file(tmp_path_factory):
+    """有効なYAML front matterを持つファイルを一度だけ作成するフィクスチャ（変更しないこと）"""
+    file_path = tmp_path_factory.mktemp("valid_content") / "test.md"
+    file_path.write_bytes(
+        b'---\ndescription: Test description\nglobs: ["*.md"]\n---\nContent'
+    )
+    return file_path
+
+
 @pytest.fixture
 def invalid_md_file(temp_dir):
     """無効なマークダウンファイルを作成するフィクスチャ"""
@@ -58,36 +71,137 @@ def test_ensure_directory(temp_dir):
     assert test_dir.exists()
     assert test_dir.is_dir()
 
+    # 削除されたディレクトリは再作成される
+    test_dir.rmdir()
+    ensure_directory(test_dir)
+    assert test_dir.is_dir()
+
+
+def test_list_files(temp_dir):
+    """list_filesが通常のファイルだけをPathで返すことのテスト"""
+    nested_dir = temp_dir / "nested"
+    nested_dir.mkdir()
+    (temp_dir / "a.md").write_text("a")
+    (nested_dir / "b.md").write_text("b")
+    (nested_dir / "c.txt").write_text("c")
+    (temp_dir / "link.md").symlink_to(temp_dir / "a.md")
+
+    assert list_files(temp_dir) == [temp_dir / "a.md"]
+    assert sorted(list_files(temp_dir, pattern="*.md", recursive=True)) == [
+        temp_dir / "a.md",
+        nested_dir / "b.md",
+    ]
+    assert list_files(temp_dir / "missing") == []
+
+
+# ファイル読み込み関連のテスト
+def test_read_file_cached(valid_md_file):
+    """read_fileのキャッシュと書き込み時の無効化テスト"""
+    read_file.cache_clear()
+    content = read_file(valid_md_file)
+    assert read_file(str(valid_md_file)) == content
+    assert utils._read_file_cached.cache_info().hits == 1
+
+    write_file(valid_md_file, "updated", force=True)
+    assert read_file(valid_md_file) == "updated"
+
+
+def test_read_file_large_not_cached(temp_dir):
+    """大きなファイルはread_fileのキャッシュに保持されないことのテスト"""
+    read_file.cache_clear()
+    file_path = temp_dir / "large.md"
+    file_path.write_text("a" * (utils._READ_CACHE_MAX_SIZE + 1))
+
+    assert len(read_file(file_path)) == utils._READ_CACHE_MAX_SIZE + 1
+    assert utils._read_file_cached.cache_info().currsize == 0
+
 
 # YAMLフロントマター関連のテスト
-def test_read_yaml_front_matter_valid(tmp_path):
+def test_read_yaml_front_matter_valid(valid_content_file):
     """有効なYAML front matterの読み込みテスト"""
-    file_path = tmp_path / "test.md"
-    with open(file_path, "w") as f:
-        f.write(
-            """---
-description: Test description
-globs: ["*.md"]
----
-Content"""
-        )
-
-    front_matter = read_yaml_front_matter(str(file_path))
+    front_matter = read_yaml_front_matter(str(valid_content_file))
     assert isinstance(front_matter, dict)
     assert front_matter["description"] == "Test description"
     assert front_matter["globs"] == ["*.md"]
 
 
-def test_read_yaml_front_matter_invalid(tmp_path):
+def test_read_yaml_front_matter_invalid(fs):
     """無効なYAML front matterの読み込みテスト"""
-    file_path = tmp_path / "test.md"
-    with open(file_path, "w") as f:
-        f.write("Content without front matter")
+    file_path = fs.create_file(
+        "/t/test.md", contents="Content without front matter"
+    ).path
 
     with pytest.raises(ValidationError):
         read_yaml_front_matter(str(file_path))
 
 
+def test_read_yaml_front_matter_cache(valid_md_file, front_matter_cache_dir):
+    """YAML front matterのキャッシュ利用テスト"""
+    front_matter = read_yaml_front_matter(valid_md_file)
+    assert front_matter["description"] == "Test description"
+    assert len(list(front_matter_cache_dir.glob("*.json"))) == 1
+
+    # キャッシュから同じ内容が読み込まれることを確認
+    assert read_yaml_front_matter(valid_md_file) == front_matter
+
+    # ファイルを更新するとキャッシュが無効になることを確認
+    valid_md_file.write_text(
+        """---
+description: "Updated description"
+---
+"""
+    )
+    assert read_yaml_front_matter(valid_md_file) == {
+        "description": "Updated description"
+    }
+    # 古いエントリは残さず、同じキャッシュファイルが上書きされることを確認
+    assert len(list(front_matter_cache_dir.glob("*.json"))) == 1
+
+
+def test_read_yaml_front_matter_returns_copy(valid_md_file):
+    """戻り値を変更してもキャッシュされた内容に影響しないことのテスト"""
+    front_matter = read_yaml_front_matter(valid_md_file)
+    front_matter["description"] = "Changed"
+    assert read_yaml_front_matter(valid_md_file)["description"] == "Test description"
+
+
+def test_read_yaml_front_matter_memoized(valid_md_file, monkeypatch):
+    """同じファイルのYAML front matterがプロセス内で再パースされないことのテスト"""
+    monkeypatch.setattr(utils, "_front_matter_cache_enabled", False)
+    front_matter = read_yaml_front_matter(valid_md_file)
+
+    hits = utils._read_front_matter_cached.cache_info().hits
+    assert read_yaml_front_matter(valid_md_file) == front_matter
+    assert utils._read_front_matter_cached.cache_info().hits == hits + 1
+
+
+def test_read_yaml_front_matter_no_cache(
+    valid_md_file, front_matter_cache_dir, monkeypatch
+):
+    """キャッシュ無効時のYAML front matterの読み込みテスト"""
+    monkeypatch.setattr(utils, "_front_matter_cache_enabled", False)
+    front_matter = read_yaml_front_matter(valid_md_file)
+    assert front_matter["description"] == "Test description"
+    assert not front_matter_cache_dir.exists()
+
+
+def test_read_yaml_front_matter_not_persistent(valid_md_file, front_matter_cache_dir):
+    """persistent=Falseでは永続キャッシュに書き込まないことのテスト"""
+    front_matter = read_yaml_front_matter(valid_md_file, persistent=False)
+    assert front_matter["description"] == "Test description"
+    assert validate_file_content(valid_md_file, ["description"]) == []
+    assert not front_matter_cache_dir.exists()
+
+
+def test_read_yaml_front_matter_without_front_matter(invalid_md_file, monkeypatch):
+    """front matterのないファイルではYAMLをパースしないことのテスト"""
+    def fail(text):
+        raise AssertionError("load_yaml should not be called")
+
+    monkeypatch.setattr(utils, "load_yaml", fail)
+    assert read_yaml_front_matter(invalid_md_file) is None
+
+
 def test_validate_yaml_front_matter_valid():
     """有効なYAML front matterの検証テスト"""
     front_matter = {"description": "Test description", "globs": ["*.md"]}
@@ -101,75 +215,79 @@ def test_validate_yaml_front_matter_invalid():
 
 
 # ファイル検証関連のテスト
-def test_validate_file_format_valid(tmp_path):
+def test_validate_file_format_valid(fs):
     """有効なファイル形式の検証テスト"""
-    file_path = tmp_path / "test.md"
-    file_path.touch()
+    file_path = fs.create_file("/t/test.md").path
     assert validate_file_format(str(file_path)) is True
 
 
-def test_validate_file_format_invalid(tmp_path):
+def test_validate_file_format_invalid(fs):
     """無効なファイル形式の検証テスト"""
-    file_path = tmp_path / "test.txt"
-    file_path.touch()
+    file_path = fs.create_file("/t/test.txt").path
     assert validate_file_format(str(file_path)) is False
 
 
-def test_validate_file_size_valid(tmp_path):
+def test_validate_file_size_valid(fs):
     """有効なファイルサイズの検証テスト"""
-    file_path = tmp_path / "test.md"
-    with open(file_path, "w") as f:
-        f.write("Small content")
+    file_path = fs.create_file("/t/test.md", contents="Small content").path
     assert validate_file_size(str(file_path)) is True
 
 
-def test_validate_file_size_invalid(tmp_path):
+def test_validate_file_size_invalid(fs):
     """無効なファイルサイズの検証テスト"""
-    file_path = tmp_path / "test.md"
-    with open(file_path, "w") as f:
-        f.write("x" * (1024 * 1024 + 1))  # 1MB + 1 byte
+    # 1MB + 1 byte
+    file_path = fs.create_file("/t/test.md", st_size=1024 * 1024 + 1).path
     assert validate_file_size(str(file_path)) is False
 
 
-def test_validate_file_content_valid(tmp_path):
+def test_validate_file_size_known_size():
+    """statを省略してサイズを直接渡す検証テスト"""
+    assert validate_file_size(1024, 1024) is True
+    with pytest.raises(ValidationError):
+        validate_file_size(1025, 1024)
+
+
+def test_validate_file_content_valid(valid_content_file):
     """有効なファイル内容の検証テスト"""
-    file_path = tmp_path / "test.md"
-    with open(file_path, "w") as f:
-        f.write(
-            """---
-description: Test description
-globs: ["*.md"]
----
-Content"""
-        )
-    assert validate_file_content(str(file_path)) is True
+    assert validate_file_content(str(valid_content_file)) is True
 
 
-def test_validate_file_content_invalid(tmp_path):
+def test_validate_file_content_invalid(fs):
     """無効なファイル内容の検証テスト"""
-    file_path = tmp_path / "test.md"
-    with open(file_path, "w") as f:
-        f.write("Content without front matter")
+    file_path = fs.create_file(
+        "/t/test.md", contents="Content without front matter"
+    ).path
     assert validate_file_content(str(file_path)) is False
 
 
-def test_validate_file_structure_valid(tmp_path):
+def test_validate_file_content_large_file(tmp_path, valid_md_file):
+    """mmapで読み込む大きなファイルの内容検証テスト"""
+    file_path = tmp_path / "large.md"
+    file_path.write_text(valid_md_file.read_text() + "description: body\n" * 1024)
+    assert validate_file_content(file_path, ["description", "globs"]) == []
+    assert validate_file_content(file_path, ["title"]) == ["title"]
+
+
+def test_validate_file_structure_valid(valid_content_file):
     """有効なファイル構造の検証テスト"""
-    file_path = tmp_path / "test.md"
-    with open(file_path, "w") as f:
-        f.write(
-            """---
-description: Test description
-globs: ["*.md"]
----
-Content"""
-        )
-    assert validate_file_structure(str(file_path)) is True
+    assert validate_file_structure(str(valid_content_file)) is True
 
 
-def test_validate_file_structure_invalid(tmp_path):
+def test_validate_file_structure_invalid(fs):
     """無効なファイル構造の検証テスト"""
-    file_path = tmp_path / "test.md"
-    with open(file_path, "w") as f:
-        f.write("Content without front matter")
+    file_path = fs.create_file(
+        "/t/test.md", contents="Content without front matter"
+    ).path
     assert validate_file_structure(str(file_path)) is False
+
+
+def test_validate_file_structure_cached(valid_md_file):
+    """変更のないファイルを再検証してもファイルを読み直さないことのテスト"""
+    utils._read_bytes_cached.cache_clear()
+    assert validate_file_structure(valid_md_file) is True
+    assert validate_file_structure(valid_md_file) is True
+    assert utils._read_bytes_cached.cache_info().hits == 1
+
+    # 書き込み後は新しい内容で検証されることを確認
+    write_file(valid_md_file, "Content without front matter", force=True)
+    assert validate_file_structure(valid_md_file) is False
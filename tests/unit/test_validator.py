@@ -19,6 +19,8 @@ globs: ["src/**/*.ts"]
     validator = FileValidator(["title", "description", "globs"])
     errors = validator.validate_file(file_path)
     assert not errors
+    assert validator.validate_file(str(file_path)) == []
+
 
 def test_validate_file_missing_required(tmp_path):
     """必須フィールドが欠けている場合のテスト"""
@@ -36,6 +38,7 @@ globs: ["src/**/*.ts"]
     errors = validator.validate_file(file_path)
     assert "description" in errors
 
+
 def test_validate_file_invalid_yaml(tmp_path):
     """無効なYAMLの場合のテスト"""
     # テスト用のファイルを作成
@@ -50,4 +53,50 @@ globs: [invalid yaml
     
     validator = FileValidator(["title", "description", "globs"])
     errors = validator.validate_file(file_path)
-    assert errors  # YAMLのパースエラーが発生するため、エラーが返される 
\ No newline at end of file
+    assert errors  # YAMLのパースエラーが発生するため、エラーが返される
+
+
+def test_validate_files(tmp_path):
+    """複数のファイルを検証し、欠けているフィールドがあるファイルだけを返すテスト"""
+    files = []
+    for i in range(4):
+        file_path = tmp_path / f"rule{i}.md"
+        required = 'title: "Rule"\n' if i % 2 else ""
+        file_path.write_text(f"---\n{required}globs: []\n---\n")
+        files.append(file_path)
+
+    validator = FileValidator(["title", "globs"])
+    results = validator.validate_files(files)
+    assert set(results) == set(files[::2])
+    assert all(missing == ["title"] for missing in results.values())
+
+
+def test_validate_directory_skips_symlinks(tmp_path):
+    """サブディレクトリは検証し、シンボリックリンクはたどらないことのテスト"""
+    nested_dir = tmp_path / "nested"
+    nested_dir.mkdir()
+    invalid_file = nested_dir / "invalid.md"
+    invalid_file.write_text('---\nglobs: []\n---\n')
+    (tmp_path / "link.md").symlink_to(invalid_file)
+
+    validator = FileValidator(["title", "globs"])
+    assert validator.validate_directory(tmp_path) == {invalid_file: ["title"]}
+
+
+def test_validate_file_default_fields(tmp_path):
+    """既定の必須フィールドで、欠けているフィールドが指定した順に返されるテスト"""
+    file_path = tmp_path / "test.md"
+    file_path.write_text('---\ntitle: "Test Rule"\n---\n')
+
+    validator = FileValidator()
+    assert validator.validate_file(file_path) == ["description", "tags", "severity"]
+
+
+def test_validate_file_skips_persistent_cache(tmp_path, front_matter_cache_dir):
+    """検証ではYAML front matterの永続キャッシュを書き込まないことのテスト"""
+    file_path = tmp_path / "test.md"
+    file_path.write_text('---\ntitle: "Test Rule"\n---\n')
+
+    validator = FileValidator(["title"])
+    assert validator.validate_file(file_path) == []
+    assert not front_matter_cache_dir.exists()